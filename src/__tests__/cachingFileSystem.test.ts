@@ -0,0 +1,105 @@
+import { test, expect, describe, beforeEach, afterEach } from 'vitest';
+import fs from 'fs-extra';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { LocalFileSystem } from '../utils/storage/LocalFileSystem.js';
+import { CachingFileSystem } from '../utils/storage/CachingFileSystem.js';
+import { ETagUtils } from '../utils/ETagUtils.js';
+
+// Get the directory name
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+describe('CachingFileSystem Tests', () => {
+  const tempDir = path.join(__dirname, 'temp-caching-fs-test-dir');
+
+  beforeEach(async () => {
+    await fs.ensureDir(tempDir);
+  });
+
+  afterEach(async () => {
+    await fs.remove(tempDir);
+  });
+
+  test('Should always read current file contents', async () => {
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'original');
+    const cachingFs = new CachingFileSystem(new LocalFileSystem(tempDir), { ttlMs: 60000 });
+
+    expect(await cachingFs.readFile('notes.md')).toBe('original');
+
+    // Change the file behind the cache's back
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'changed externally');
+    expect(await cachingFs.readFile('notes.md')).toBe('changed externally');
+  });
+
+  test('Should detect an ETag conflict after an external write', async () => {
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'original');
+    const cachingFs = new CachingFileSystem(new LocalFileSystem(tempDir), { ttlMs: 60000 });
+
+    const etag = ETagUtils.calculateETag(await cachingFs.readFile('notes.md'));
+
+    // Another client updates the file within the TTL
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'changed externally');
+    expect(ETagUtils.validateETag(await cachingFs.readFile('notes.md'), etag)).toBe(false);
+  });
+
+  test('Should share concurrent reads of the same file', async () => {
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'original');
+    const cachingFs = new CachingFileSystem(new LocalFileSystem(tempDir), { ttlMs: 60000 });
+
+    const [first, second] = await Promise.all([
+      cachingFs.readFile('notes.md'),
+      cachingFs.readFile('notes.md'),
+    ]);
+    expect(first).toBe('original');
+    expect(second).toBe('original');
+  });
+
+  test('Should list files created by other clients', async () => {
+    const cachingFs = new CachingFileSystem(new LocalFileSystem(tempDir), { ttlMs: 60000 });
+    expect(await cachingFs.listFiles('.')).toEqual([]);
+
+    await fs.writeFile(path.join(tempDir, 'notes.md'), 'created externally');
+    expect(await cachingFs.listFiles('.')).toEqual(['notes.md']);
+  });
+
+  test('Should not cache an existence check that raced a write', async () => {
+    let release!: () => void;
+    const gate = new Promise<void>((resolve) => { release = resolve; });
+    // Holds existence checks back until released
+    class GatedFileSystem extends LocalFileSystem {
+      async fileExists(filePath: string): Promise<boolean> {
+        const exists = await super.fileExists(filePath);
+        await gate;
+        return exists;
+      }
+    }
+    const cachingFs = new CachingFileSystem(new GatedFileSystem(tempDir), { ttlMs: 60000 });
+
+    const check = cachingFs.fileExists('log.md');
+    await new Promise((resolve) => setTimeout(resolve, 20));
+    await cachingFs.writeFile('log.md', 'written meanwhile');
+    release();
+
+    expect(await check).toBe(false);
+    expect(await cachingFs.fileExists('log.md')).toBe(true);
+  });
+
+  test('Should reflect writes, appends and deletes made through it', async () => {
+    const cachingFs = new CachingFileSystem(new LocalFileSystem(tempDir), { ttlMs: 60000 });
+
+    expect(await cachingFs.fileExists('log.md')).toBe(false);
+
+    await cachingFs.writeFile('log.md', 'first\n');
+    expect(await cachingFs.fileExists('log.md')).toBe(true);
+    expect(await cachingFs.readFile('log.md')).toBe('first\n');
+    expect(await cachingFs.listFiles('.')).toContain('log.md');
+
+    await cachingFs.appendFile('log.md', 'second\n');
+    expect(await cachingFs.readFile('log.md')).toBe('first\nsecond\n');
+
+    await cachingFs.delete('log.md');
+    expect(await cachingFs.fileExists('log.md')).toBe(false);
+    expect(await cachingFs.listFiles('.')).not.toContain('log.md');
+  });
+});
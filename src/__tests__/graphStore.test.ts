@@ -9,12 +9,12 @@ import { existsSync, mkdirSync, rmSync, readFileSync, writeFileSync } from 'fs';
 import path from 'path';
 import { GraphStore } from '../core/graph/GraphStore.js';
 import { LocalFileSystem } from '../utils/storage/LocalFileSystem.js';
-import { reduceEventsToSnapshot, reduceJsonlToSnapshot, calculateStats } from '../core/graph/GraphReducer.js';
+import { reduceEventsToSnapshot, reduceJsonlToSnapshot, calculateStats, applyEventToSnapshot } from '../core/graph/GraphReducer.js';
 import { searchGraph, findEntity, expandNeighborhood, getEntityObservations } from '../core/graph/GraphSearch.js';
 import { renderGraphToMarkdown, renderSearchResults } from '../core/graph/GraphRenderer.js';
 import { createEntityId, createObservationId, createRelationId, normalizeName } from '../core/graph/GraphIds.js';
 import { isEntity, isObservation, isRelation, isMarkerEvent, validateEntityInput, validateObservationInput, validateRelationInput } from '../core/graph/GraphSchemas.js';
-import type { Entity, EntityId, GraphEvent, GraphSnapshot, MarkerEvent, EntityInput, ObservationInput, RelationInput } from '../types/graph.js';
+import type { DataEvent, Entity, EntityId, GraphEvent, GraphSnapshot, MarkerEvent, EntityInput, ObservationInput, RelationInput } from '../types/graph.js';
 import { MARKER_EVENT, GRAPH_PATHS } from '../types/graph.js';
 
 const TEST_DIR = path.join(process.cwd(), 'src/__tests__/temp-graph-test-dir');
@@ -224,6 +224,39 @@ describe('Knowledge Graph Tests', () => {
       }
     });
 
+    test('applyEventToSnapshot should match a full replay', () => {
+      const now = new Date().toISOString();
+      const a: Entity = { id: 'ent_a' as EntityId, name: 'A', entityType: 'person', createdAt: now, updatedAt: now };
+      const b: Entity = { id: 'ent_b' as EntityId, name: 'B', entityType: 'project', createdAt: now, updatedAt: now };
+      const events: DataEvent[] = [
+        { type: 'entity_upsert', entity: a, ts: now },
+        { type: 'entity_upsert', entity: b, ts: now },
+        { type: 'observation_add', observation: { id: 'obs_1' as any, entityId: a.id, text: 'first', timestamp: now }, ts: now },
+        { type: 'observation_add', observation: { id: 'obs_2' as any, entityId: b.id, text: 'second', timestamp: now }, ts: now },
+        { type: 'relation_add', relation: { id: createRelationId(a.id, b.id, 'works_on'), fromId: a.id, toId: b.id, relationType: 'works_on', createdAt: now }, ts: now },
+        { type: 'entity_upsert', entity: { ...a, name: 'A renamed' }, ts: now },
+        { type: 'observation_delete', entityId: b.id, observationId: 'obs_2' as any, ts: now },
+        { type: 'relation_remove', fromId: a.id, toId: b.id, relationType: 'works_on', ts: now },
+        { type: 'entity_delete', entityId: b.id, ts: now },
+      ];
+
+      const initial = reduceEventsToSnapshot([MARKER_EVENT], 'test-store');
+      if (!initial.success) throw new Error(initial.error);
+      let snapshot = initial.snapshot;
+      for (let i = 0; i < events.length; i++) {
+        const before = snapshot;
+        snapshot = applyEventToSnapshot(snapshot, events[i]);
+        const replayed = reduceEventsToSnapshot([MARKER_EVENT, ...events.slice(0, i + 1)], 'test-store');
+        expect(replayed.success).toBe(true);
+        if (replayed.success) {
+          expect(snapshot.entities).toEqual(replayed.snapshot.entities);
+          expect(snapshot.observations).toEqual(replayed.snapshot.observations);
+          expect(snapshot.relations).toEqual(replayed.snapshot.relations);
+        }
+        expect(snapshot).not.toBe(before);
+      }
+    });
+
     test('calculateStats should compute graph statistics', () => {
       const snapshot: GraphSnapshot = {
         meta: {
@@ -324,6 +357,20 @@ describe('Knowledge Graph Tests', () => {
       expect(observations.length).toBe(1);
       expect(observations[0].text).toContain('software engineer');
     });
+
+    test('getEntityObservations should return newest observations first', () => {
+      const snapshot: GraphSnapshot = {
+        ...testSnapshot,
+        observations: [
+          { id: 'obs_a' as any, entityId: 'ent_1' as EntityId, text: 'older', timestamp: '2024-01-01T00:00:00.000Z' },
+          { id: 'obs_b' as any, entityId: 'ent_2' as EntityId, text: 'other entity', timestamp: '2024-06-01T00:00:00.000Z' },
+          { id: 'obs_c' as any, entityId: 'ent_1' as EntityId, text: 'newer', timestamp: '2024-03-01T00:00:00.000Z' },
+        ],
+      };
+      const observations = getEntityObservations(snapshot, 'ent_1' as EntityId);
+      expect(observations.map(o => o.text)).toEqual(['newer', 'older']);
+      expect(getEntityObservations(snapshot, 'ent_3' as EntityId)).toEqual([]);
+    });
   });
 
   // ============================================================================
@@ -535,6 +582,98 @@ describe('Knowledge Graph Tests', () => {
       expect(existsSync(path.join(GRAPH_DIR, 'graph.md'))).toBe(true);
     });
 
+    test('should keep snapshot and views in sync with appended events', async () => {
+      const fs = new LocalFileSystem(TEST_DIR);
+      const store = new GraphStore(fs, '', 'test-store');
+      await store.initialize();
+
+      await store.upsertEntity({ name: 'Alice', entityType: 'person' });
+      await store.upsertEntity({ name: 'Bob', entityType: 'person' });
+      await store.addObservation({ entityRef: 'Alice', text: 'Prefers TypeScript' });
+      await store.deleteEntity('Bob');
+
+      const snapshot = await store.getSnapshot();
+      expect(snapshot.success).toBe(true);
+      if (!snapshot.success) return;
+
+      // Incrementally maintained snapshot must match a full replay of the log
+      const jsonl = readFileSync(path.join(GRAPH_DIR, 'graph.jsonl'), 'utf-8');
+      const replayed = reduceJsonlToSnapshot(jsonl, 'test-store');
+      expect(replayed.success).toBe(true);
+      if (!replayed.success) return;
+      expect(snapshot.data.entities).toEqual(replayed.snapshot.entities);
+      expect(snapshot.data.observations).toEqual(replayed.snapshot.observations);
+      expect(snapshot.data.relations).toEqual(replayed.snapshot.relations);
+
+      // Markdown view reflects the latest state
+      const markdown = readFileSync(path.join(GRAPH_DIR, 'graph.md'), 'utf-8');
+      expect(markdown).toContain('Alice');
+      expect(markdown).not.toContain('Bob');
+    });
+
+    test('should pick up events appended by another writer', async () => {
+      const fs = new LocalFileSystem(TEST_DIR);
+      const store = new GraphStore(fs, '', 'test-store');
+      await store.initialize();
+
+      await store.upsertEntity({ name: 'Alice', entityType: 'person' });
+      expect((await store.getSnapshot()).success).toBe(true);
+
+      // Simulate a second process appending to the log
+      const jsonlPath = path.join(GRAPH_DIR, 'graph.jsonl');
+      const other = new GraphStore(new LocalFileSystem(TEST_DIR), '', 'test-store');
+      await other.upsertEntity({ name: 'Carol', entityType: 'person' });
+
+      const snapshot = await store.getSnapshot();
+      expect(snapshot.success).toBe(true);
+      if (!snapshot.success) return;
+
+      const replayed = reduceJsonlToSnapshot(readFileSync(jsonlPath, 'utf-8'), 'test-store');
+      expect(replayed.success).toBe(true);
+      if (!replayed.success) return;
+      expect(snapshot.data.entities).toEqual(replayed.snapshot.entities);
+      expect(snapshot.data.entities.map(e => e.name)).toEqual(['Alice', 'Carol']);
+      expect(readFileSync(path.join(GRAPH_DIR, 'graph.md'), 'utf-8')).toContain('Carol');
+    });
+
+    test('should detect a same-length rewrite after its own append', async () => {
+      const fs = new LocalFileSystem(TEST_DIR);
+      const store = new GraphStore(fs, '', 'test-store');
+      await store.initialize();
+      expect((await store.getSnapshot()).success).toBe(true);
+
+      await store.upsertEntity({ name: 'Alice', entityType: 'person' });
+
+      // Another writer rewrites the log without changing its length
+      const jsonlPath = path.join(GRAPH_DIR, 'graph.jsonl');
+      writeFileSync(jsonlPath, readFileSync(jsonlPath, 'utf-8').replace(/Alice/g, 'Alicf'));
+
+      const snapshot = await store.getSnapshot();
+      expect(snapshot.success).toBe(true);
+      if (snapshot.success) {
+        expect(snapshot.data.entities.map(e => e.name)).toEqual(['Alicf']);
+      }
+    });
+
+    test('should share overlapping snapshot reads but not across writes', async () => {
+      const fs = new LocalFileSystem(TEST_DIR);
+      const store = new GraphStore(fs, '', 'test-store');
+      await store.initialize();
+
+      const [first, second] = await Promise.all([store.getSnapshot(), store.getSnapshot()]);
+      expect(second).toBe(first);
+
+      // A read started before a write must not be reused after it
+      const before = store.getSnapshot();
+      await store.upsertEntity({ name: 'Dave', entityType: 'person' });
+      const after = await store.getSnapshot();
+      expect(after).not.toBe(await before);
+      expect(after.success).toBe(true);
+      if (after.success) {
+        expect(after.data.entities.map(e => e.name)).toContain('Dave');
+      }
+    });
+
     test('should validate marker before operations', async () => {
       // Write invalid marker
       writeFileSync(
@@ -197,4 +197,26 @@ describe('ThinkingTools', () => {
       resetThinking();
     });
   });
+
+  describe('history retention', () => {
+    test('should cap per-session history length', () => {
+      resetThinking();
+
+      let parsed: { thoughtHistoryLength: number } = { thoughtHistoryLength: 0 };
+      for (let i = 1; i <= 1005; i++) {
+        const result = handleSequentialThinking({
+          thought: `Thought ${i}`,
+          nextThoughtNeeded: true,
+          thoughtNumber: i,
+          totalThoughts: 1005,
+          sessionId: 'cap-test',
+        });
+        parsed = JSON.parse(result.content[0].text);
+      }
+
+      expect(parsed.thoughtHistoryLength).toBe(1000);
+
+      resetThinking();
+    });
+  });
 });
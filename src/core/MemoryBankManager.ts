@@ -45,6 +45,16 @@ const ALLOWED_CORE_FILES = [
   'system-patterns.json',
 ];
 
+/**
+ * File extensions accepted by validateFilename
+ */
+const ALLOWED_EXTENSIONS: ReadonlySet<string> = new Set(['.md', '.json']);
+
+/**
+ * Names of the files created from the core templates
+ */
+const CORE_FILE_NAMES: readonly string[] = coreTemplates.map(template => template.name);
+
 /**
  * Validates a filename to prevent path traversal attacks
  * 
@@ -78,9 +88,8 @@ function validateFilename(filename: string): { valid: boolean; sanitized: string
   }
   
   // Check for allowed file extensions
-  const allowedExtensions = ['.md', '.json'];
   const ext = path.extname(sanitized).toLowerCase();
-  if (!allowedExtensions.includes(ext)) {
+  if (!ALLOWED_EXTENSIONS.has(ext)) {
     return { valid: false, sanitized: '', error: 'Only .md and .json files are allowed' };
   }
   
@@ -438,14 +447,11 @@ export class MemoryBankManager {
           throw new Error('File system cannot be initialized: no base directory available');
         }
         
-        // Create the Memory Bank directory if it doesn't exist
-        const exists = await this.fileSystem.fileExists(relativeMemoryBankPath);
-        const isDir = exists ? await this.fileSystem.isDirectory(relativeMemoryBankPath) : false;
-        
-        if (!exists || !isDir) {
-          logger.info('MemoryBankManager', `Creating Memory Bank directory at ${absoluteMemoryBankPath}`);
-          await this.fileSystem.ensureDirectory(relativeMemoryBankPath);
-        }
+        // Create the Memory Bank directory if it doesn't exist. ensureDirectory
+        // is idempotent, so no existence pre-check (an extra round-trip per
+        // probe on remote banks, and racy anyway) is needed.
+        logger.info('MemoryBankManager', `Ensuring Memory Bank directory at ${absoluteMemoryBankPath}`);
+        await this.fileSystem.ensureDirectory(relativeMemoryBankPath);
         
         // Create core template files if they don't exist
         for (const template of coreTemplates) {
@@ -607,8 +613,9 @@ export class MemoryBankManager {
       }
       
       const files = await this.listFiles();
-      const coreFiles = coreTemplates.map(template => template.name);
-      const missingCoreFiles = coreFiles.filter(file => !files.includes(file));
+      const fileSet = new Set(files);
+      const coreFilesPresent = CORE_FILE_NAMES.filter(file => fileSet.has(file));
+      const missingCoreFiles = CORE_FILE_NAMES.filter(file => !fileSet.has(file));
       
       // Get last update time
       let lastUpdated: Date | undefined;
@@ -640,7 +647,7 @@ export class MemoryBankManager {
       return {
         path: this.memoryBankDir,
         files,
-        coreFilesPresent: coreFiles.filter(file => files.includes(file)),
+        coreFilesPresent,
         missingCoreFiles,
         isComplete: missingCoreFiles.length === 0,
         language: this.language,
@@ -827,12 +834,12 @@ export class MemoryBankManager {
         return allowedExtensions.includes(ext);
       });
       
+      // Copy inside the file system rather than read + write, so file contents
+      // are never buffered here (and never cross the SSH link for remote banks)
+      const sourceDir = this.getFileSystemPath()!;
+      const joinPath = this.isRemote ? path.posix.join : path.join;
       for (const file of validFiles) {
-        const content = await this.readFile(file);
-        const backupFilePath = this.isRemote 
-          ? path.posix.join(backupPath, file)
-          : path.join(backupPath, file);
-        await this.fileSystem.writeFile(backupFilePath, content);
+        await this.fileSystem.copy(joinPath(sourceDir, file), joinPath(backupPath, file));
       }
       
       logger.debug('MemoryBankManager', `Memory Bank backup created at ${backupPath}`);
@@ -871,9 +878,13 @@ export class MemoryBankManager {
    * Scans the parent directory for backup folders matching the pattern
    * `memory-bank-backup-TIMESTAMP`.
    * 
+   * Candidates are ordered by the timestamp in their name before any
+   * directory checks, so with a limit only the newest entries are verified.
+   * 
+   * @param limit - Optional maximum number of backups to return
    * @returns Array of backup info objects sorted by timestamp (newest first)
    */
-  async listBackups(): Promise<Array<{ id: string; timestamp: string; path: string }>> {
+  async listBackups(limit?: number): Promise<Array<{ id: string; timestamp: string; path: string }>> {
     if (!this.memoryBankDir) {
       throw new Error('Memory Bank directory not set');
     }
@@ -892,34 +903,38 @@ export class MemoryBankManager {
       
       // Filter for backup directories
       const backupPattern = /^memory-bank-backup-(\d{4}-\d{2}-\d{2}T[\d-]+)$/;
-      const backups: Array<{ id: string; timestamp: string; path: string }> = [];
+      const candidates: Array<{ id: string; timestamp: string; path: string }> = [];
       
       for (const entry of entries) {
         const name = entry.endsWith('/') ? entry.slice(0, -1) : entry;
         const match = name.match(backupPattern);
         if (match) {
-          const backupPath = this.isRemote 
-            ? path.posix.join(parentDir, name)
-            : path.join(parentDir, name);
-          
-          // Verify it's a directory
-          try {
-            const isDir = await this.fileSystem.isDirectory(backupPath);
-            if (isDir) {
-              backups.push({
-                id: name,
-                timestamp: match[1].replace(/-/g, ':').replace('T', ' '),
-                path: backupPath,
-              });
-            }
-          } catch {
-            // Skip if we can't verify
-          }
+          candidates.push({
+            id: name,
+            timestamp: match[1].replace(/-/g, ':').replace('T', ' '),
+            path: this.isRemote 
+              ? path.posix.join(parentDir, name)
+              : path.join(parentDir, name),
+          });
         }
       }
       
       // Sort by timestamp (newest first)
-      backups.sort((a, b) => b.timestamp.localeCompare(a.timestamp));
+      candidates.sort((a, b) => b.timestamp.localeCompare(a.timestamp));
+      
+      const maxResults = limit ?? candidates.length;
+      const backups: Array<{ id: string; timestamp: string; path: string }> = [];
+      for (const candidate of candidates) {
+        if (backups.length >= maxResults) break;
+        // Verify it's a directory
+        try {
+          if (await this.fileSystem.isDirectory(candidate.path)) {
+            backups.push(candidate);
+          }
+        } catch {
+          // Skip if we can't verify
+        }
+      }
       
       logger.debug('MemoryBankManager', `Found ${backups.length} backups`);
       return backups;
@@ -1049,21 +1064,34 @@ export class MemoryBankManager {
         return;
       }
 
-      // Create the ExternalRulesLoader for the project
-      this.rulesLoader = new ExternalRulesLoader(this.projectPath);
+      // Create the ExternalRulesLoader for the project. The replacements are
+      // fully set up before the current instances are touched, so a failure
+      // leaves the working mode manager in place.
+      const rulesLoader = new ExternalRulesLoader(this.projectPath);
+      // Create the ModeManager with the rules loader
+      const modeManager = new ModeManager(rulesLoader);
+      try {
+        // Ensure all .mcprules-{mode} files exist before loading rules
+        const validation = await rulesLoader.validateRequiredFiles();
+        if (!validation.valid && validation.missingFiles.length > 0) {
+          logger.info('MemoryBankManager', `Creating missing mcprules files: ${validation.missingFiles.join(', ')}`);
+          await rulesLoader.createMissingMcpRules(validation.missingFiles);
+        }
 
-      // Ensure all .mcprules-{mode} files exist before loading rules
-      const validation = await this.rulesLoader.validateRequiredFiles();
-      if (!validation.valid && validation.missingFiles.length > 0) {
-        logger.info('MemoryBankManager', `Creating missing mcprules files: ${validation.missingFiles.join(', ')}`);
-        await this.rulesLoader.createMissingMcpRules(validation.missingFiles);
+        // Initialize with the specified mode or default
+        await modeManager.initialize(initialMode || 'code');
+      } catch (error) {
+        modeManager.dispose();
+        rulesLoader.dispose();
+        throw error;
       }
 
-      // Create the ModeManager with the rules loader
-      this.modeManager = new ModeManager(this.rulesLoader);
-
-      // Initialize with the specified mode or default
-      await this.modeManager.initialize(initialMode || 'code');
+      // Re-initializing replaces the loader; release the previous one's file
+      // watchers so they don't leak a descriptor per rule file
+      this.modeManager?.dispose();
+      this.rulesLoader?.dispose();
+      this.rulesLoader = rulesLoader;
+      this.modeManager = modeManager;
 
       // Set memory bank status if memory bank is initialized
       if (this.memoryBankDir) {
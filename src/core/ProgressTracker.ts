@@ -65,6 +65,16 @@ interface ActiveContext {
   sessionNotes?: string[];
 }
 
+/** Section headers that new entries are inserted after */
+const UPDATE_HISTORY_HEADER = /## Update History\s+/;
+const SESSION_NOTES_HEADER = /## Current Session Notes\s+/;
+
+/** Whole sections (header through the next heading) that get replaced */
+const ONGOING_TASKS_SECTION = /## Ongoing Tasks[\s\S]*?(?=\n## |$)/;
+const KNOWN_ISSUES_SECTION = /## Known Issues[\s\S]*?(?=\n## |$)/;
+const NEXT_STEPS_SECTION = /## Next Steps[\s\S]*?(?=\n## |$)/;
+const SESSION_NOTES_SECTION = /## Current Session Notes[\s\S]*?(?=\n## |$)/;
+
 /**
  * Class for tracking progress and logging decisions
  * 
@@ -78,6 +88,8 @@ export class ProgressTracker {
   private fileSystem: FileSystemInterface | null = null;
   private memoryBankRelativePath: string = '';
   private isRemote: boolean = false;
+  // Last formatted user ID, keyed by its raw value (usually the tracker's own user)
+  private formattedUser: { userId: string; formatted: string } | null = null;
 
   /**
    * Creates a new ProgressTracker instance
@@ -158,13 +170,30 @@ export class ProgressTracker {
    * Formats the username for display in markdown
    * 
    * If the userId is a GitHub URL, it will be formatted as [@username](url)
-   * Otherwise, the username is returned as-is
+   * Otherwise, the username is returned as-is. The result is cached since
+   * every entry is written by the same user in practice.
    * 
    * @param userId - The username or GitHub profile URL
    * @returns Formatted username string
    * @private
    */
   private formatUserId(userId: string): string {
+    if (this.formattedUser?.userId === userId) {
+      return this.formattedUser.formatted;
+    }
+    const formatted = this.computeFormattedUserId(userId);
+    this.formattedUser = { userId, formatted };
+    return formatted;
+  }
+
+  /**
+   * Builds the display form of a user ID, parsing GitHub profile URLs
+   * 
+   * @param userId - The username or GitHub profile URL
+   * @returns Formatted username string
+   * @private
+   */
+  private computeFormattedUserId(userId: string): string {
     // Check if the userId is a GitHub URL
     if (userId.includes('github.com/')) {
       try {
@@ -201,11 +230,12 @@ export class ProgressTracker {
         details.userId = this.userId;
       }
       
-      // Update the progress file
-      const updatedContent = await this.updateProgressFile(action, details);
-      
-      // Update the active context file
-      await this.updateActiveContextFile(action, details);
+      // Update the progress and active context files concurrently; they are
+      // independent, and each is a read/write round-trip on remote banks
+      const [updatedContent] = await Promise.all([
+        this.updateProgressFile(action, details),
+        this.updateActiveContextFile(action, details),
+      ]);
       
       // Return the updated progress content
       return updatedContent;
@@ -226,17 +256,16 @@ export class ProgressTracker {
     try {
       let progressContent = await this.readFileContent('progress.md');
       
-      const timestamp = new Date().toISOString().split('T')[0];
-      const time = new Date().toISOString().split('T')[1].split('.')[0]; // Use ISO time for consistency
+      const [timestamp, isoTime] = new Date().toISOString().split('T');
+      const time = isoTime.split('.')[0]; // Use ISO time for consistency
       const userId = details.userId || this.userId;
       const formattedUserId = this.formatUserId(userId);
       const newEntry = `- [${timestamp} ${time}] [${formattedUserId}] - ${action}: ${details.description}`;
       
       // Add the entry to the update history section
-      const updateHistoryRegex = /## Update History\s+/;
-      if (updateHistoryRegex.test(progressContent)) {
+      if (UPDATE_HISTORY_HEADER.test(progressContent)) {
         progressContent = progressContent.replace(
-          updateHistoryRegex,
+          UPDATE_HISTORY_HEADER,
           `## Update History\n\n${newEntry}\n`
         );
       } else {
@@ -266,15 +295,14 @@ export class ProgressTracker {
       let contextContent = await this.readFileContent('active-context.md');
       
       // Add the entry to the current session notes section
-      const sessionNotesRegex = /## Current Session Notes\s+/;
       const time = new Date().toISOString().split('T')[1].split('.')[0]; // Use ISO time for consistency
       const userId = details.userId || this.userId;
       const formattedUserId = this.formatUserId(userId);
       const newNote = `- [${time}] [${formattedUserId}] ${action}: ${details.description}`;
       
-      if (sessionNotesRegex.test(contextContent)) {
+      if (SESSION_NOTES_HEADER.test(contextContent)) {
         contextContent = contextContent.replace(
-          sessionNotesRegex,
+          SESSION_NOTES_HEADER,
           `## Current Session Notes\n\n${newNote}\n`
         );
       } else {
@@ -309,8 +337,8 @@ export class ProgressTracker {
       if (context.tasks && context.tasks.length > 0) {
         const tasksSection = `## Ongoing Tasks\n\n${context.tasks.map(task => `- ${task}`).join('\n')}\n`;
         
-        if (/## Ongoing Tasks[\s\S]*?(?=\n## |$)/.test(contextContent)) {
-          contextContent = contextContent.replace(/## Ongoing Tasks[\s\S]*?(?=\n## |$)/, () => tasksSection);
+        if (ONGOING_TASKS_SECTION.test(contextContent)) {
+          contextContent = contextContent.replace(ONGOING_TASKS_SECTION, () => tasksSection);
         } else {
           // If the section doesn't exist, add it
           contextContent += `\n\n${tasksSection}`;
@@ -321,8 +349,8 @@ export class ProgressTracker {
       if (context.issues && context.issues.length > 0) {
         const issuesSection = `## Known Issues\n\n${context.issues.map(issue => `- ${issue}`).join('\n')}\n`;
         
-        if (/## Known Issues[\s\S]*?(?=\n## |$)/.test(contextContent)) {
-          contextContent = contextContent.replace(/## Known Issues[\s\S]*?(?=\n## |$)/, () => issuesSection);
+        if (KNOWN_ISSUES_SECTION.test(contextContent)) {
+          contextContent = contextContent.replace(KNOWN_ISSUES_SECTION, () => issuesSection);
         } else {
           // If the section doesn't exist, add it
           contextContent += `\n\n${issuesSection}`;
@@ -333,8 +361,8 @@ export class ProgressTracker {
       if (context.nextSteps && context.nextSteps.length > 0) {
         const nextStepsSection = `## Next Steps\n\n${context.nextSteps.map(step => `- ${step}`).join('\n')}\n`;
         
-        if (/## Next Steps[\s\S]*?(?=\n## |$)/.test(contextContent)) {
-          contextContent = contextContent.replace(/## Next Steps[\s\S]*?(?=\n## |$)/, () => nextStepsSection);
+        if (NEXT_STEPS_SECTION.test(contextContent)) {
+          contextContent = contextContent.replace(NEXT_STEPS_SECTION, () => nextStepsSection);
         } else {
           // If the section doesn't exist, add it
           contextContent += `\n\n${nextStepsSection}`;
@@ -358,10 +386,9 @@ export class ProgressTracker {
       let contextContent = await this.readFileContent('active-context.md');
       
       // Replace the current session notes with an empty section
-      const sessionNotesRegex = /## Current Session Notes[\s\S]*?(?=\n## |$)/;
-      if (sessionNotesRegex.test(contextContent)) {
+      if (SESSION_NOTES_SECTION.test(contextContent)) {
         contextContent = contextContent.replace(
-          sessionNotesRegex,
+          SESSION_NOTES_SECTION,
           () => `## Current Session Notes\n\n`
         );
         
@@ -385,8 +412,8 @@ export class ProgressTracker {
     try {
       let decisionLogContent = await this.readFileContent('decision-log.md');
       
-      const timestamp = new Date().toISOString().split('T')[0];
-      const time = new Date().toISOString().split('T')[1].split('.')[0]; // Use ISO time for consistency
+      const [timestamp, isoTime] = new Date().toISOString().split('T');
+      const time = isoTime.split('.')[0]; // Use ISO time for consistency
       const userId = decision.userId || this.userId;
       const formattedUserId = this.formatUserId(userId);
       
@@ -43,6 +43,9 @@ export interface StoreRegistryFile {
 
 const REGISTRY_FILENAME = 'stores.json';
 
+/** Delay before coalesced lastUsedAt updates are written to disk */
+const TOUCH_FLUSH_DELAY_MS = 1000;
+
 const EMPTY_REGISTRY: StoreRegistryFile = {
   version: 1,
   selectedStoreId: null,
@@ -54,8 +57,14 @@ const EMPTY_REGISTRY: StoreRegistryFile = {
 // ============================================================================
 
 export class StoreRegistry {
+  private static instance: StoreRegistry | null = null;
   private readonly registryPath: string;
   private cache: StoreRegistryFile | null = null;
+  // storeId -> entry lookup, rebuilt lazily after changes or when asked about
+  // a different registry object than the one it was built from
+  private storeIndex: Map<string, StoreRegistryEntry> | null = null;
+  private indexedRegistry: StoreRegistryFile | null = null;
+  private touchFlushTimer: NodeJS.Timeout | null = null;
 
   /**
    * @param configDir Directory where stores.json will be stored (default: CWD)
@@ -65,6 +74,20 @@ export class StoreRegistry {
     this.registryPath = path.join(dir, REGISTRY_FILENAME);
   }
 
+  /**
+   * Get the process-wide registry for the default config dir.
+   *
+   * Tool modules must share one instance: each instance caches stores.json
+   * and flushes it on its own, so separate copies would load the file twice
+   * and overwrite each other's changes.
+   */
+  static getInstance(): StoreRegistry {
+    if (!StoreRegistry.instance) {
+      StoreRegistry.instance = new StoreRegistry();
+    }
+    return StoreRegistry.instance;
+  }
+
   // ---------- Read operations ----------
 
   /** Load the registry from disk (cached after first load within a session). */
@@ -108,7 +131,7 @@ export class StoreRegistry {
   /** Get a store by its storeId. Returns null if not found. */
   async getStore(storeId: string): Promise<StoreRegistryEntry | null> {
     const registry = await this.load();
-    return registry.stores.find(s => s.storeId === storeId) ?? null;
+    return this.findStore(registry, storeId);
   }
 
   /** Get the currently selected storeId. */
@@ -145,6 +168,7 @@ export class StoreRegistry {
     } else {
       registry.stores.push(full);
     }
+    this.storeIndex = null;
 
     await this.save(registry);
     return full;
@@ -155,6 +179,7 @@ export class StoreRegistry {
     const registry = await this.load();
     const before = registry.stores.length;
     registry.stores = registry.stores.filter(s => s.storeId !== storeId);
+    this.storeIndex = null;
 
     if (registry.stores.length === before) {
       return false; // Nothing removed
@@ -174,7 +199,7 @@ export class StoreRegistry {
     const registry = await this.load();
 
     if (storeId !== null) {
-      const entry = registry.stores.find(s => s.storeId === storeId);
+      const entry = this.findStore(registry, storeId);
       if (!entry) {
         throw new Error(`Store "${storeId}" not found in registry`);
       }
@@ -185,13 +210,48 @@ export class StoreRegistry {
     await this.save(registry);
   }
 
-  /** Touch a store's lastUsedAt timestamp. */
+  /**
+   * Touch a store's lastUsedAt timestamp.
+   *
+   * Called on every store-targeted tool call, so the write is deferred and
+   * bursts of touches are coalesced into a single save. Any other write
+   * persists the pending timestamp as well.
+   */
   async touchStore(storeId: string): Promise<void> {
     const registry = await this.load();
-    const entry = registry.stores.find(s => s.storeId === storeId);
-    if (entry) {
-      entry.lastUsedAt = new Date().toISOString();
-      await this.save(registry);
+    const entry = this.findStore(registry, storeId);
+    if (!entry) {
+      return;
+    }
+
+    entry.lastUsedAt = new Date().toISOString();
+    if (this.touchFlushTimer) {
+      return;
+    }
+
+    this.touchFlushTimer = setTimeout(() => {
+      this.touchFlushTimer = null;
+      // Save whatever registry is current: the one captured here may have been
+      // replaced since (invalidateCache/load) and must not be reinstated
+      if (!this.cache) {
+        return;
+      }
+      this.save(this.cache).catch((error) => {
+        logger.warn('StoreRegistry', `Failed to save lastUsedAt updates: ${error}`);
+      });
+    }, TOUCH_FLUSH_DELAY_MS);
+    this.touchFlushTimer.unref?.();
+  }
+
+  /** Write any pending lastUsedAt updates to disk immediately. */
+  async flush(): Promise<void> {
+    if (!this.touchFlushTimer) {
+      return;
+    }
+    clearTimeout(this.touchFlushTimer);
+    this.touchFlushTimer = null;
+    if (this.cache) {
+      await this.save(this.cache);
     }
   }
 
@@ -200,10 +260,25 @@ export class StoreRegistry {
   /** Invalidate the in-memory cache (forces re-read on next access). */
   invalidateCache(): void {
     this.cache = null;
+    this.storeIndex = null;
+  }
+
+  /** Look up an entry by storeId without scanning the store list. */
+  private findStore(registry: StoreRegistryFile, storeId: string): StoreRegistryEntry | null {
+    if (!this.storeIndex || this.indexedRegistry !== registry) {
+      this.storeIndex = new Map(registry.stores.map(s => [s.storeId, s]));
+      this.indexedRegistry = registry;
+    }
+    return this.storeIndex.get(storeId) ?? null;
   }
 
   /** Write the registry to disk and update cache. */
   private async save(registry: StoreRegistryFile): Promise<void> {
+    if (this.touchFlushTimer) {
+      clearTimeout(this.touchFlushTimer);
+      this.touchFlushTimer = null;
+    }
+
     try {
       const dir = path.dirname(this.registryPath);
       await FileUtils.ensureDirectory(dir);
@@ -9,10 +9,21 @@ import type { EntityId, ObservationId, RelationId } from '../../types/graph.js';
 import { createHash } from 'crypto';
 
 /**
- * Generates a short, URL-safe hash from input string
+ * Generates a short, URL-safe hash from the `:`-joined parts
+ *
+ * Parts are fed to the hash one at a time, which hashes the same bytes as
+ * the joined string without building it (observation text can be long).
+ *
+ * Base64 maps each 3 input bytes to 4 characters, so encoding only the first
+ * 9 digest bytes yields exactly the first 12 characters of the full encoding
+ * without building and slicing the whole string.
  */
-function shortHash(input: string): string {
-  return createHash('sha256').update(input).digest('base64url').slice(0, 12);
+function shortHash(...parts: string[]): string {
+  const hash = createHash('sha256').update(parts[0]);
+  for (let i = 1; i < parts.length; i++) {
+    hash.update(':').update(parts[i]);
+  }
+  return hash.digest().subarray(0, 9).toString('base64url');
 }
 
 /**
@@ -30,8 +41,7 @@ export function normalizeName(name: string): string {
  * Same name+type always produces the same ID (idempotent)
  */
 export function createEntityId(name: string, entityType: string): EntityId {
-  const normalized = `${normalizeName(name)}:${entityType.toLowerCase()}`;
-  return `ent_${shortHash(normalized)}` as EntityId;
+  return `ent_${shortHash(normalizeName(name), entityType.toLowerCase())}` as EntityId;
 }
 
 /**
@@ -45,8 +55,7 @@ export function createObservationId(
   text: string,
   timestamp: string
 ): ObservationId {
-  const input = `${entityId}:${text}:${timestamp}`;
-  return `obs_${shortHash(input)}` as ObservationId;
+  return `obs_${shortHash(entityId, text, timestamp)}` as ObservationId;
 }
 
 /**
@@ -58,8 +67,7 @@ export function createRelationId(
   toId: EntityId,
   relationType: string
 ): RelationId {
-  const normalized = `${fromId}:${relationType.toLowerCase()}:${toId}`;
-  return `rel_${shortHash(normalized)}` as RelationId;
+  return `rel_${shortHash(fromId, relationType.toLowerCase(), toId)}` as RelationId;
 }
 
 /**
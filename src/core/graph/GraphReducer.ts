@@ -111,6 +111,68 @@ function applyEvent(state: MutableGraphState, event: DataEvent): MutableGraphSta
 // Main Reducer Functions
 // ============================================================================
 
+/**
+ * Folds one event into the state, skipping non-data events
+ *
+ * @param index Position of the event in the log (for diagnostics)
+ */
+function foldEvent(state: MutableGraphState, event: GraphEvent, index: number): void {
+  // Skip marker events and snapshot_written events
+  if (event.type === 'memory_bank_graph' || event.type === 'snapshot_written') {
+    return;
+  }
+  try {
+    applyEvent(state, event as DataEvent);
+  } catch (err) {
+    // Defensive: if a structurally-valid event still blows up at runtime,
+    // skip it rather than crashing the whole reduction.
+    logger.warn(
+      'GraphReducer',
+      `Event ${index} (${event.type}) skipped due to error: ${err instanceof Error ? err.message : String(err)}`
+    );
+  }
+}
+
+/**
+ * Iterates over the non-blank lines of JSONL content
+ *
+ * Walks the string with indexOf instead of split(), so large logs are not
+ * materialized as an array of lines before processing starts.
+ */
+function* nonBlankLines(content: string): Generator<string> {
+  let start = 0;
+  while (start <= content.length) {
+    let end = content.indexOf('\n', start);
+    if (end === -1) {
+      end = content.length;
+    }
+    const line = content.slice(start, end);
+    if (line.trim().length > 0) {
+      yield line;
+    }
+    start = end + 1;
+  }
+}
+
+/**
+ * Converts the reduction state into an immutable snapshot
+ */
+function stateToSnapshot(state: MutableGraphState, storeId: string): GraphSnapshot {
+  const now = new Date().toISOString();
+  return {
+    meta: {
+      type: 'memory_bank_graph',
+      version: '1',
+      storeId,
+      createdAt: now,
+      source: 'memory-bank-mcp',
+    },
+    entities: Array.from(state.entities.values()),
+    observations: Array.from(state.observations.values()),
+    relations: Array.from(state.relations.values()),
+  };
+}
+
 /**
  * Reduces an array of events into a snapshot
  *
@@ -136,44 +198,18 @@ export function reduceEventsToSnapshot(
   const state = createEmptyState();
 
   for (let i = 1; i < events.length; i++) {
-    const event = events[i];
-    // Skip marker events and snapshot_written events
-    if (event.type === 'memory_bank_graph' || event.type === 'snapshot_written') {
-      continue;
-    }
-    try {
-      applyEvent(state, event as DataEvent);
-    } catch (err) {
-      // Defensive: if a structurally-valid event still blows up at runtime,
-      // skip it rather than crashing the whole reduction.
-      logger.warn(
-        'GraphReducer',
-        `Event ${i} (${event.type}) skipped due to error: ${err instanceof Error ? err.message : String(err)}`
-      );
-    }
+    foldEvent(state, events[i], i);
   }
 
-  // Convert to immutable snapshot
-  const now = new Date().toISOString();
-  const snapshot: GraphSnapshot = {
-    meta: {
-      type: 'memory_bank_graph',
-      version: '1',
-      storeId,
-      createdAt: now,
-      source: 'memory-bank-mcp',
-    },
-    entities: Array.from(state.entities.values()),
-    observations: Array.from(state.observations.values()),
-    relations: Array.from(state.relations.values()),
-  };
-
-  return { success: true, snapshot };
+  return { success: true, snapshot: stateToSnapshot(state, storeId) };
 }
 
 /**
  * Parses JSONL content and reduces to snapshot
  *
+ * Each line is parsed, validated and folded into the state in a single pass,
+ * without collecting an intermediate array of events.
+ *
  * @param jsonlContent Raw JSONL file content
  * @param storeId Store identifier
  * @returns Result with snapshot or error
@@ -182,46 +218,161 @@ export function reduceJsonlToSnapshot(
   jsonlContent: string,
   storeId: string
 ): { success: true; snapshot: GraphSnapshot } | { success: false; error: string } {
-  const lines = jsonlContent.split('\n').filter((line) => line.trim().length > 0);
-
-  if (lines.length === 0) {
-    return { success: false, error: 'JSONL file is empty' };
-  }
+  const state = createEmptyState();
+  let lineNumber = 0;
+  let eventCount = 0;
+  let parseErrors = 0;
 
-  const events: GraphEvent[] = [];
-  const parseErrors: string[] = [];
+  for (const line of nonBlankLines(jsonlContent)) {
+    lineNumber++;
 
-  for (let i = 0; i < lines.length; i++) {
+    let parsed: unknown;
     try {
-      const parsed: unknown = JSON.parse(lines[i]);
-
-      // Use full structural validation — not just `typeof type === 'string'`
-      if (!isGraphEvent(parsed)) {
-        const snippet = lines[i].length > 80 ? lines[i].slice(0, 80) + '…' : lines[i];
-        const msg = `Line ${i + 1}: Invalid event structure — skipping (${snippet})`;
-        parseErrors.push(msg);
-        logger.warn('GraphReducer', msg);
-        continue;
-      }
-
-      events.push(parsed);
+      parsed = JSON.parse(line);
     } catch (err) {
-      const msg = `Line ${i + 1}: ${err instanceof Error ? err.message : String(err)}`;
-      parseErrors.push(msg);
-      logger.warn('GraphReducer', msg);
+      parseErrors++;
+      logger.warn('GraphReducer', `Line ${lineNumber}: ${err instanceof Error ? err.message : String(err)}`);
+      continue;
+    }
+
+    // Use full structural validation — not just `typeof type === 'string'`
+    if (!isGraphEvent(parsed)) {
+      const snippet = line.length > 80 ? line.slice(0, 80) + '…' : line;
+      parseErrors++;
+      logger.warn('GraphReducer', `Line ${lineNumber}: Invalid event structure — skipping (${snippet})`);
+      continue;
     }
+
+    // The first valid event must be the marker; everything after it is data
+    if (eventCount === 0) {
+      if (!isMarkerEvent(parsed)) {
+        return { success: false, error: 'First event must be a valid marker' };
+      }
+    } else {
+      foldEvent(state, parsed, eventCount);
+    }
+    eventCount++;
+  }
+
+  if (lineNumber === 0) {
+    return { success: false, error: 'JSONL file is empty' };
   }
 
   // Log warnings but do NOT abort — skip malformed lines and continue with
   // valid events so one corrupted line doesn't take down the whole graph.
-  if (parseErrors.length > 0) {
+  if (parseErrors > 0) {
     logger.warn(
       'GraphReducer',
-      `Skipped ${parseErrors.length} malformed line(s) while reducing JSONL`
+      `Skipped ${parseErrors} malformed line(s) while reducing JSONL`
     );
   }
 
-  return reduceEventsToSnapshot(events, storeId);
+  if (eventCount === 0) {
+    return { success: false, error: 'Event log is empty' };
+  }
+
+  return { success: true, snapshot: stateToSnapshot(state, storeId) };
+}
+
+/**
+ * Returns a copy of `items` with `item` replacing the element of the same id,
+ * or appended when no element has that id (same ordering as a Map rebuild)
+ */
+function upsertById<T extends { readonly id: string }>(items: readonly T[], item: T): T[] {
+  const index = items.findIndex(existing => existing.id === item.id);
+  const next = items.slice();
+  if (index >= 0) {
+    next[index] = item;
+  } else {
+    next.push(item);
+  }
+  return next;
+}
+
+/**
+ * Applies a single data event to an existing snapshot
+ *
+ * Produces the same result as replaying the full log with the event appended,
+ * without re-parsing the JSONL. Only the collections the event touches are
+ * copied; the others are shared with the input snapshot, which is not mutated.
+ *
+ * @param snapshot Snapshot built from the log before the event
+ * @param event Event that was appended to the log
+ * @returns Updated snapshot
+ */
+export function applyEventToSnapshot(snapshot: GraphSnapshot, event: DataEvent): GraphSnapshot {
+  switch (event.type) {
+    case 'entity_upsert':
+      return { ...snapshot, entities: upsertById(snapshot.entities, event.entity) };
+
+    case 'observation_add':
+      return { ...snapshot, observations: upsertById(snapshot.observations, event.observation) };
+
+    case 'relation_add':
+      return { ...snapshot, relations: upsertById(snapshot.relations, event.relation) };
+
+    case 'relation_remove': {
+      const relationId = createRelationId(event.fromId, event.toId, event.relationType);
+      return { ...snapshot, relations: snapshot.relations.filter(rel => rel.id !== relationId) };
+    }
+
+    case 'entity_delete': {
+      const entityId = event.entityId;
+      return {
+        ...snapshot,
+        entities: snapshot.entities.filter(entity => entity.id !== entityId),
+        observations: snapshot.observations.filter(obs => obs.entityId !== entityId),
+        relations: snapshot.relations.filter(rel => rel.fromId !== entityId && rel.toId !== entityId),
+      };
+    }
+
+    case 'observation_delete':
+      return { ...snapshot, observations: snapshot.observations.filter(obs => obs.id !== event.observationId) };
+
+    default:
+      // Unknown event type — nothing to apply, matching applyEvent
+      return { ...snapshot };
+  }
+}
+
+/**
+ * Applies JSONL lines appended to a log onto the snapshot built before them
+ *
+ * Each line is folded in with applyEventToSnapshot, so only the tail of the
+ * log is parsed. Unlike reduceJsonlToSnapshot, a malformed line is not skipped:
+ * the caller is expected to fall back to a full replay instead.
+ *
+ * @param snapshot Snapshot built from the log before the appended lines
+ * @param appendedContent JSONL content appended after that log
+ * @returns Updated snapshot and number of lines applied, or null if a line is invalid
+ */
+export function applyJsonlToSnapshot(
+  snapshot: GraphSnapshot,
+  appendedContent: string
+): { snapshot: GraphSnapshot; lineCount: number } | null {
+  let next = snapshot;
+  let lineCount = 0;
+
+  for (const line of nonBlankLines(appendedContent)) {
+    let parsed: unknown;
+    try {
+      parsed = JSON.parse(line);
+    } catch {
+      return null;
+    }
+    if (!isGraphEvent(parsed)) {
+      return null;
+    }
+    lineCount++;
+
+    // Skip marker events and snapshot_written events, as foldEvent does
+    if (parsed.type === 'memory_bank_graph' || parsed.type === 'snapshot_written') {
+      continue;
+    }
+    next = applyEventToSnapshot(next, parsed as DataEvent);
+  }
+
+  return { snapshot: next, lineCount };
 }
 
 /**
@@ -338,5 +489,9 @@ export function filterByEntityTypes(
  * Gets the line count from JSONL content
  */
 export function getEventLineCount(jsonlContent: string): number {
-  return jsonlContent.split('\n').filter((line) => line.trim().length > 0).length;
+  let count = 0;
+  for (const _line of nonBlankLines(jsonlContent)) {
+    count++;
+  }
+  return count;
 }
@@ -44,27 +44,35 @@ const DEFAULT_OPTIONS: Required<RenderOptions> = {
 // Helper Functions
 // ============================================================================
 
+/**
+ * Shared formatter for absolute dates. Constructing the formatter resolves
+ * locale data, so it is built once instead of via toLocaleDateString() per call.
+ */
+const DATE_FORMAT = new Intl.DateTimeFormat('en-US', {
+  year: 'numeric',
+  month: 'short',
+  day: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+});
+
 /**
  * Formats a date for display
  */
 function formatDate(isoString: string): string {
   const date = new Date(isoString);
-  return date.toLocaleDateString('en-US', {
-    year: 'numeric',
-    month: 'short',
-    day: 'numeric',
-    hour: '2-digit',
-    minute: '2-digit',
-  });
+  // Intl.DateTimeFormat#format throws on invalid dates; toLocaleDateString didn't
+  return Number.isNaN(date.getTime()) ? 'Invalid Date' : DATE_FORMAT.format(date);
 }
 
 /**
  * Formats a date for relative display
+ *
+ * @param nowMs Reference time, taken once per render
  */
-function formatRelativeDate(isoString: string): string {
+function formatRelativeDate(isoString: string, nowMs: number): string {
   const date = new Date(isoString);
-  const now = new Date();
-  const diffMs = now.getTime() - date.getTime();
+  const diffMs = nowMs - date.getTime();
   const diffDays = Math.floor(diffMs / (1000 * 60 * 60 * 24));
 
   if (diffDays === 0) {
@@ -116,6 +124,37 @@ function getEntityName(
   return entity ? entity.name : entityId;
 }
 
+/**
+ * Lookups shared by every section of a single render pass
+ */
+interface RenderContext {
+  /** Render time used for all relative dates */
+  nowMs: number;
+  entityMap: Map<EntityId, Entity>;
+  /** All observations, newest first (stable for equal timestamps) */
+  observationsNewestFirst: Observation[];
+}
+
+/**
+ * Builds the shared lookups once per render
+ */
+function buildRenderContext(snapshot: GraphSnapshot): RenderContext {
+  const entityMap = new Map<EntityId, Entity>();
+  for (const entity of snapshot.entities) {
+    entityMap.set(entity.id, entity);
+  }
+
+  // Parse each timestamp once rather than on every comparison
+  const times = new Map<Observation, number>();
+  for (const obs of snapshot.observations) {
+    times.set(obs, new Date(obs.timestamp).getTime());
+  }
+  const observationsNewestFirst = [...snapshot.observations]
+    .sort((a, b) => times.get(b)! - times.get(a)!);
+
+  return { nowMs: Date.now(), entityMap, observationsNewestFirst };
+}
+
 // ============================================================================
 // Section Renderers
 // ============================================================================
@@ -166,7 +205,8 @@ function renderStats(stats: GraphStats): string {
  */
 function renderEntities(
   snapshot: GraphSnapshot,
-  options: Required<RenderOptions>
+  options: Required<RenderOptions>,
+  context: RenderContext
 ): string {
   if (snapshot.entities.length === 0) {
     return '## Entities\n\n*No entities in graph.*\n';
@@ -177,20 +217,14 @@ function renderEntities(
     '',
   ];
 
-  // Build observation lookup
+  // Build observation lookup (newest first, inherited from the shared ordering)
   const observationsByEntity = new Map<EntityId, Observation[]>();
-  for (const obs of snapshot.observations) {
+  for (const obs of context.observationsNewestFirst) {
     const existing = observationsByEntity.get(obs.entityId) ?? [];
     existing.push(obs);
     observationsByEntity.set(obs.entityId, existing);
   }
 
-  // Sort observations by timestamp (newest first)
-  for (const [entityId, obs] of observationsByEntity) {
-    obs.sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
-    observationsByEntity.set(entityId, obs);
-  }
-
   // Build relation lookup
   const relationsFrom = new Map<EntityId, Relation[]>();
   const relationsTo = new Map<EntityId, Relation[]>();
@@ -204,12 +238,6 @@ function renderEntities(
     relationsTo.set(rel.toId, toRels);
   }
 
-  // Entity ID to name map
-  const entityMap = new Map<EntityId, Entity>();
-  for (const entity of snapshot.entities) {
-    entityMap.set(entity.id, entity);
-  }
-
   // Group by type if option enabled
   if (options.sortByType) {
     const groups = groupByType(snapshot.entities);
@@ -220,45 +248,63 @@ function renderEntities(
       lines.push(`### ${type} (${entities.length})`, '');
 
       for (const entity of entities.sort((a, b) => a.name.localeCompare(b.name))) {
-        lines.push(...renderEntity(entity, observationsByEntity, relationsFrom, relationsTo, entityMap, options));
+        renderEntity(lines, entity, observationsByEntity, relationsFrom, relationsTo, options, context);
       }
     }
   } else {
     // Just sort alphabetically
     const sorted = [...snapshot.entities].sort((a, b) => a.name.localeCompare(b.name));
     for (const entity of sorted) {
-      lines.push(...renderEntity(entity, observationsByEntity, relationsFrom, relationsTo, entityMap, options));
+      renderEntity(lines, entity, observationsByEntity, relationsFrom, relationsTo, options, context);
     }
   }
 
   return lines.join('\n');
 }
 
+// Rendered attribute lines per entity. Entities are replaced, never mutated,
+// when they change, so unchanged entities reuse their lines across renders.
+const attributeLinesCache = new WeakMap<Entity, readonly string[]>();
+
+/**
+ * Gets (formatting on first use) the attribute list lines of an entity
+ */
+function getAttributeLines(entity: Entity): readonly string[] {
+  let attrLines = attributeLinesCache.get(entity);
+  if (!attrLines) {
+    attrLines = entity.attrs
+      ? Object.entries(entity.attrs).map(([key, value]) => `  - ${key}: ${JSON.stringify(value)}`)
+      : [];
+    attributeLinesCache.set(entity, attrLines);
+  }
+  return attrLines;
+}
+
 /**
- * Renders a single entity
+ * Renders a single entity, appending its lines to `lines`.
+ * Appending in place avoids a temporary array and spread per entity.
  */
 function renderEntity(
+  lines: string[],
   entity: Entity,
   observationsByEntity: Map<EntityId, Observation[]>,
   relationsFrom: Map<EntityId, Relation[]>,
   relationsTo: Map<EntityId, Relation[]>,
-  entityMap: Map<EntityId, Entity>,
-  options: Required<RenderOptions>
-): string[] {
-  const lines: string[] = [];
+  options: Required<RenderOptions>,
+  context: RenderContext
+): void {
+  const { entityMap, nowMs } = context;
 
   // Entity header
   lines.push(`#### ${entity.name}`, '');
   lines.push(`- **Type:** ${entity.entityType}`);
   lines.push(`- **ID:** \`${entity.id}\``);
-  lines.push(`- **Created:** ${formatRelativeDate(entity.createdAt)}`);
+  lines.push(`- **Created:** ${formatRelativeDate(entity.createdAt, nowMs)}`);
 
   // Attributes
-  if (entity.attrs && Object.keys(entity.attrs).length > 0) {
-    lines.push(`- **Attributes:**`);
-    for (const [key, value] of Object.entries(entity.attrs)) {
-      lines.push(`  - ${key}: ${JSON.stringify(value)}`);
-    }
+  const attrLines = getAttributeLines(entity);
+  if (attrLines.length > 0) {
+    lines.push(`- **Attributes:**`, ...attrLines);
   }
 
   // Relations
@@ -288,7 +334,7 @@ function renderEntity(
     lines.push('', '**Recent Observations:**');
     for (const obs of toShow) {
       const text = truncate(obs.text, 100);
-      lines.push(`- ${formatRelativeDate(obs.timestamp)}: ${text}`);
+      lines.push(`- ${formatRelativeDate(obs.timestamp, nowMs)}: ${text}`);
     }
     if (observations.length > options.maxObservationsPerEntity) {
       lines.push(`- *...and ${observations.length - options.maxObservationsPerEntity} more*`);
@@ -296,13 +342,12 @@ function renderEntity(
   }
 
   lines.push('');
-  return lines;
 }
 
 /**
  * Renders the relations section (as a graph view)
  */
-function renderRelations(snapshot: GraphSnapshot): string {
+function renderRelations(snapshot: GraphSnapshot, context: RenderContext): string {
   if (snapshot.relations.length === 0) {
     return '## Relations\n\n*No relations in graph.*\n';
   }
@@ -312,18 +357,17 @@ function renderRelations(snapshot: GraphSnapshot): string {
     '',
   ];
 
-  // Entity ID to name map
-  const entityMap = new Map<EntityId, Entity>();
-  for (const entity of snapshot.entities) {
-    entityMap.set(entity.id, entity);
-  }
+  const { entityMap } = context;
 
   // Group by relation type
   const byType = new Map<string, Relation[]>();
   for (const rel of snapshot.relations) {
-    const existing = byType.get(rel.relationType) ?? [];
+    let existing = byType.get(rel.relationType);
+    if (!existing) {
+      existing = [];
+      byType.set(rel.relationType, existing);
+    }
     existing.push(rel);
-    byType.set(rel.relationType, existing);
   }
 
   const sortedTypes = Array.from(byType.keys()).sort();
@@ -332,10 +376,10 @@ function renderRelations(snapshot: GraphSnapshot): string {
     const relations = byType.get(type)!;
     lines.push(`### ${type} (${relations.length})`, '');
     lines.push('```');
+    // The arrow is the same for every relation of this type
+    const arrow = ` --${type}--> `;
     for (const rel of relations) {
-      const fromName = getEntityName(rel.fromId, entityMap);
-      const toName = getEntityName(rel.toId, entityMap);
-      lines.push(`${fromName} --${type}--> ${toName}`);
+      lines.push(getEntityName(rel.fromId, entityMap) + arrow + getEntityName(rel.toId, entityMap));
     }
     lines.push('```', '');
   }
@@ -347,8 +391,8 @@ function renderRelations(snapshot: GraphSnapshot): string {
  * Renders recent activity section
  */
 function renderRecentActivity(
-  snapshot: GraphSnapshot,
-  options: Required<RenderOptions>
+  options: Required<RenderOptions>,
+  context: RenderContext
 ): string {
   const lines: string[] = [
     '## Recent Activity',
@@ -356,25 +400,19 @@ function renderRecentActivity(
   ];
 
   // Get recent observations
-  const recentObs = [...snapshot.observations]
-    .sort((a, b) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime())
-    .slice(0, options.maxRecentObservations);
+  const recentObs = context.observationsNewestFirst.slice(0, options.maxRecentObservations);
 
   if (recentObs.length === 0) {
     lines.push('*No recent activity.*', '');
     return lines.join('\n');
   }
 
-  // Entity ID to name map
-  const entityMap = new Map<EntityId, Entity>();
-  for (const entity of snapshot.entities) {
-    entityMap.set(entity.id, entity);
-  }
+  const { entityMap } = context;
 
   for (const obs of recentObs) {
     const entityName = getEntityName(obs.entityId, entityMap);
     const text = truncate(obs.text, 80);
-    lines.push(`- **${formatRelativeDate(obs.timestamp)}** on _${entityName}_: ${text}`);
+    lines.push(`- **${formatRelativeDate(obs.timestamp, context.nowMs)}** on _${entityName}_: ${text}`);
   }
 
   lines.push('');
@@ -398,6 +436,7 @@ export function renderGraphToMarkdown(
 ): string {
   const opts = { ...DEFAULT_OPTIONS, ...options };
   const stats = calculateStats(snapshot);
+  const context = buildRenderContext(snapshot);
 
   const sections: string[] = [
     renderHeader(snapshot),
@@ -408,19 +447,37 @@ export function renderGraphToMarkdown(
   }
 
   if (opts.includeRecentActivity) {
-    sections.push(renderRecentActivity(snapshot, opts));
+    sections.push(renderRecentActivity(opts, context));
   }
 
-  sections.push(renderEntities(snapshot, opts));
-  sections.push(renderRelations(snapshot));
+  sections.push(renderEntities(snapshot, opts, context));
+  sections.push(renderRelations(snapshot, context));
 
   return sections.join('\n');
 }
 
+// Summaries keyed by snapshot identity: GraphStore hands out a new snapshot
+// object whenever the graph changes, so a cached summary is never stale.
+// get_context_digest asks for the summary on every call, usually of an
+// unchanged graph.
+const graphSummaryCache = new WeakMap<GraphSnapshot, string>();
+
 /**
  * Renders a minimal graph summary (for context digest)
  */
 export function renderGraphSummary(snapshot: GraphSnapshot): string {
+  let summary = graphSummaryCache.get(snapshot);
+  if (summary === undefined) {
+    summary = buildGraphSummary(snapshot);
+    graphSummaryCache.set(snapshot, summary);
+  }
+  return summary;
+}
+
+/**
+ * Builds the summary text for renderGraphSummary
+ */
+function buildGraphSummary(snapshot: GraphSnapshot): string {
   const stats = calculateStats(snapshot);
   const lines: string[] = [
     '### Knowledge Graph Summary',
@@ -56,6 +56,16 @@ function isArray(value: unknown): value is unknown[] {
   return Array.isArray(value);
 }
 
+/**
+ * Returns the trimmed string, or null when the value is not a string or is
+ * blank. Trims once so callers don't trim again to build the result.
+ */
+function cleanString(value: unknown): string | null {
+  if (!isString(value)) return null;
+  const trimmed = value.trim();
+  return trimmed.length > 0 ? trimmed : null;
+}
+
 function isISODateString(value: unknown): value is string {
   if (!isString(value)) return false;
   const date = new Date(value);
@@ -82,11 +92,14 @@ export function isRelationId(value: unknown): value is RelationId {
 // Source Validation
 // ============================================================================
 
+/** Valid ObservationSource kinds, built once rather than per validation */
+const OBSERVATION_SOURCE_KINDS: ReadonlySet<string> = new Set(['manual', 'tool', 'import', 'agent']);
+
 export function isObservationSource(value: unknown): value is ObservationSource {
   if (!isObject(value)) return false;
   const kind = value['kind'];
   if (!isString(kind)) return false;
-  if (!['manual', 'tool', 'import', 'agent'].includes(kind)) return false;
+  if (!OBSERVATION_SOURCE_KINDS.has(kind)) return false;
   if ('ref' in value && value['ref'] !== undefined && !isString(value['ref'])) return false;
   return true;
 }
@@ -220,17 +233,25 @@ export function isSnapshotWrittenEvent(value: unknown): value is SnapshotWritten
   );
 }
 
+// Validator for each event type. Lets isGraphEvent (called for every JSONL
+// line on replay) run only the validator matching the event's type instead of
+// trying each one in turn.
+const EVENT_VALIDATORS: ReadonlyMap<string, (value: unknown) => boolean> = new Map<string, (value: unknown) => boolean>([
+  ['memory_bank_graph', isMarkerEvent],
+  ['entity_upsert', isEntityUpsertEvent],
+  ['observation_add', isObservationAddEvent],
+  ['relation_add', isRelationAddEvent],
+  ['relation_remove', isRelationRemoveEvent],
+  ['entity_delete', isEntityDeleteEvent],
+  ['observation_delete', isObservationDeleteEvent],
+  ['snapshot_written', isSnapshotWrittenEvent],
+]);
+
 export function isGraphEvent(value: unknown): value is GraphEvent {
-  return (
-    isMarkerEvent(value) ||
-    isEntityUpsertEvent(value) ||
-    isObservationAddEvent(value) ||
-    isRelationAddEvent(value) ||
-    isRelationRemoveEvent(value) ||
-    isEntityDeleteEvent(value) ||
-    isObservationDeleteEvent(value) ||
-    isSnapshotWrittenEvent(value)
-  );
+  if (!isObject(value)) return false;
+  const type = value['type'];
+  const validate = isString(type) ? EVENT_VALIDATORS.get(type) : undefined;
+  return validate !== undefined && validate(value);
 }
 
 // ============================================================================
@@ -351,15 +372,15 @@ export function validateEntityInput(
     return { valid: false, error: 'Input must be an object' };
   }
   
-  const name = input['name'];
-  const entityType = input['entityType'];
+  const name = cleanString(input['name']);
+  const entityType = cleanString(input['entityType']);
   const attrs = input['attrs'];
   
-  if (!isString(name) || name.trim().length === 0) {
+  if (name === null) {
     return { valid: false, error: 'name is required and must be a non-empty string' };
   }
   
-  if (!isString(entityType) || entityType.trim().length === 0) {
+  if (entityType === null) {
     return { valid: false, error: 'entityType is required and must be a non-empty string' };
   }
   
@@ -369,8 +390,8 @@ export function validateEntityInput(
   
   return {
     valid: true,
-    name: name.trim(),
-    entityType: entityType.trim(),
+    name,
+    entityType,
     attrs: attrs as Record<string, unknown> | undefined,
   };
 }
@@ -385,16 +406,16 @@ export function validateObservationInput(
     return { valid: false, error: 'Input must be an object' };
   }
   
-  const entityRef = input['entityRef'] ?? input['entity'];
-  const text = input['text'];
+  const entityRef = cleanString(input['entityRef'] ?? input['entity']);
+  const text = cleanString(input['text']);
   const source = input['source'];
   const timestamp = input['timestamp'];
   
-  if (!isString(entityRef) || entityRef.trim().length === 0) {
+  if (entityRef === null) {
     return { valid: false, error: 'entityRef (or entity) is required and must be a non-empty string' };
   }
   
-  if (!isString(text) || text.trim().length === 0) {
+  if (text === null) {
     return { valid: false, error: 'text is required and must be a non-empty string' };
   }
   
@@ -408,8 +429,8 @@ export function validateObservationInput(
   
   return {
     valid: true,
-    entityRef: entityRef.trim(),
-    text: text.trim(),
+    entityRef,
+    text,
     source: source as ObservationSource | undefined,
     timestamp: timestamp as string | undefined,
   };
@@ -425,26 +446,26 @@ export function validateRelationInput(
     return { valid: false, error: 'Input must be an object' };
   }
   
-  const from = input['from'];
-  const relationType = input['relationType'];
-  const to = input['to'];
+  const from = cleanString(input['from']);
+  const relationType = cleanString(input['relationType']);
+  const to = cleanString(input['to']);
   
-  if (!isString(from) || from.trim().length === 0) {
+  if (from === null) {
     return { valid: false, error: 'from is required and must be a non-empty string' };
   }
   
-  if (!isString(relationType) || relationType.trim().length === 0) {
+  if (relationType === null) {
     return { valid: false, error: 'relationType is required and must be a non-empty string' };
   }
   
-  if (!isString(to) || to.trim().length === 0) {
+  if (to === null) {
     return { valid: false, error: 'to is required and must be a non-empty string' };
   }
   
   return {
     valid: true,
-    from: from.trim(),
-    relationType: relationType.trim(),
-    to: to.trim(),
+    from,
+    relationType,
+    to,
   };
 }
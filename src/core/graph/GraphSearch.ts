@@ -43,13 +43,89 @@ function normalizeQuery(query: string): string {
   return query.trim().toLowerCase();
 }
 
+/**
+ * Lowercased searchable fields of an entity, computed once per entity object
+ */
+interface EntitySearchText {
+  name: string;
+  type: string;
+  attrs: string | null;
+}
+
+// Snapshot entities and observations are replaced, never mutated, when the
+// graph changes, so caching by object identity stays correct and lets
+// repeated queries skip re-lowercasing and re-serializing every field.
+const entitySearchTextCache = new WeakMap<Entity, EntitySearchText>();
+const observationSearchTextCache = new WeakMap<Observation, string>();
+
+/**
+ * Gets the precomputed lowercase search text for an entity
+ */
+function getEntitySearchText(entity: Entity): EntitySearchText {
+  let cached = entitySearchTextCache.get(entity);
+  if (!cached) {
+    cached = {
+      name: entity.name.toLowerCase(),
+      type: entity.entityType.toLowerCase(),
+      attrs: entity.attrs ? JSON.stringify(entity.attrs).toLowerCase() : null,
+    };
+    entitySearchTextCache.set(entity, cached);
+  }
+  return cached;
+}
+
+/**
+ * Gets the precomputed lowercase search text for an observation
+ */
+function getObservationSearchText(observation: Observation): string {
+  let cached = observationSearchTextCache.get(observation);
+  if (cached === undefined) {
+    cached = observation.text.toLowerCase();
+    observationSearchTextCache.set(observation, cached);
+  }
+  return cached;
+}
+
+/**
+ * A search query prepared once per search: lowercased, with its word-boundary
+ * pattern compiled, so scoring each field does no per-call allocation.
+ */
+interface QueryMatcher {
+  normalized: string;
+  wordBoundary: RegExp;
+}
+
+// Most recently prepared query. Entity and observation search run with the
+// same query back to back, and clients often repeat a search, so the word
+// boundary regex is compiled once and reused while the query is unchanged.
+let lastQueryMatcher: { query: string; matcher: QueryMatcher } | null = null;
+
+/**
+ * Prepares a query for repeated scoring, reusing the last prepared matcher
+ * when the query is the same
+ */
+function getQueryMatcher(query: string): QueryMatcher {
+  if (lastQueryMatcher?.query === query) {
+    return lastQueryMatcher.matcher;
+  }
+  const normalized = normalizeQuery(query);
+  const matcher: QueryMatcher = {
+    normalized,
+    wordBoundary: new RegExp(`\\b${escapeRegex(normalized)}\\b`),
+  };
+  lastQueryMatcher = { query, matcher };
+  return matcher;
+}
+
 /**
  * Calculates a simple relevance score for a match
  * Higher scores = better matches
+ *
+ * @param normalizedText Lowercased text to score
+ * @param matcher Prepared query
  */
-function calculateMatchScore(text: string, query: string): number {
-  const normalizedText = text.toLowerCase();
-  const normalizedQuery = query.toLowerCase();
+function calculateMatchScore(normalizedText: string, matcher: QueryMatcher): number {
+  const normalizedQuery = matcher.normalized;
 
   // Exact match
   if (normalizedText === normalizedQuery) {
@@ -61,18 +137,19 @@ function calculateMatchScore(text: string, query: string): number {
     return 80;
   }
 
+  // Every remaining case requires the query as a substring, so the cheap
+  // check gates the regex
+  if (!normalizedText.includes(normalizedQuery)) {
+    return 0;
+  }
+
   // Contains query as whole word
-  const wordBoundary = new RegExp(`\\b${escapeRegex(normalizedQuery)}\\b`, 'i');
-  if (wordBoundary.test(text)) {
+  if (matcher.wordBoundary.test(normalizedText)) {
     return 60;
   }
 
   // Contains query as substring
-  if (normalizedText.includes(normalizedQuery)) {
-    return 40;
-  }
-
-  return 0;
+  return 40;
 }
 
 /**
@@ -90,31 +167,31 @@ function searchEntities(
   query: string,
   limit: number
 ): EntityMatch[] {
-  const normalizedQuery = normalizeQuery(query);
+  const matcher = getQueryMatcher(query);
   const matches: EntityMatch[] = [];
 
   for (const entity of entities) {
     const matchedIn: ('name' | 'type' | 'attrs')[] = [];
     let bestScore = 0;
+    const searchText = getEntitySearchText(entity);
 
     // Check name
-    const nameScore = calculateMatchScore(entity.name, normalizedQuery);
+    const nameScore = calculateMatchScore(searchText.name, matcher);
     if (nameScore > 0) {
       matchedIn.push('name');
       bestScore = Math.max(bestScore, nameScore);
     }
 
     // Check entity type
-    const typeScore = calculateMatchScore(entity.entityType, normalizedQuery);
+    const typeScore = calculateMatchScore(searchText.type, matcher);
     if (typeScore > 0) {
       matchedIn.push('type');
       bestScore = Math.max(bestScore, typeScore * 0.8); // Type matches weighted lower
     }
 
     // Check attrs if present
-    if (entity.attrs) {
-      const attrsStr = JSON.stringify(entity.attrs);
-      const attrsScore = calculateMatchScore(attrsStr, normalizedQuery);
+    if (searchText.attrs !== null) {
+      const attrsScore = calculateMatchScore(searchText.attrs, matcher);
       if (attrsScore > 0) {
         matchedIn.push('attrs');
         bestScore = Math.max(bestScore, attrsScore * 0.6); // Attrs matches weighted lower
@@ -138,11 +215,11 @@ function searchObservations(
   query: string,
   limit: number
 ): ObservationMatch[] {
-  const normalizedQuery = normalizeQuery(query);
+  const matcher = getQueryMatcher(query);
   const matches: ObservationMatch[] = [];
 
   for (const observation of observations) {
-    const score = calculateMatchScore(observation.text, normalizedQuery);
+    const score = calculateMatchScore(getObservationSearchText(observation), matcher);
     if (score > 0) {
       matches.push({ observation, score });
     }
@@ -176,7 +253,7 @@ export function searchGraph(
   let entities: readonly Entity[] = snapshot.entities;
   if (entityTypes && entityTypes.length > 0) {
     const typeSet = new Set(entityTypes.map((t: string) => t.toLowerCase()));
-    entities = entities.filter((e: Entity) => typeSet.has(e.entityType.toLowerCase()));
+    entities = entities.filter((e: Entity) => typeSet.has(getEntitySearchText(e).type));
   }
 
   // Search or return all entities
@@ -203,17 +280,21 @@ export function searchGraph(
     observationMatches = searchObservations(snapshot.observations, query, limit);
   }
 
-  // Find relations involving matched entities
-  let matchedRelations: Relation[] = (snapshot.relations as Relation[]).filter(
-    (r: Relation) => matchedEntityIds.has(r.fromId) || matchedEntityIds.has(r.toId)
-  );
-
-  // Filter by relation type if specified
-  if (relationTypes && relationTypes.length > 0) {
-    const relTypeSet = new Set(relationTypes.map((t: string) => t.toLowerCase()));
-    matchedRelations = matchedRelations.filter((r: Relation) =>
-      relTypeSet.has(r.relationType.toLowerCase())
-    );
+  // Find relations involving matched entities, filtered by relation type
+  // if specified (single pass over the relation list)
+  const relTypeSet = relationTypes && relationTypes.length > 0
+    ? new Set(relationTypes.map((t: string) => t.toLowerCase()))
+    : null;
+  const matchedRelations: Relation[] = [];
+  if (matchedEntityIds.size > 0) {
+    for (const r of snapshot.relations) {
+      if (
+        (matchedEntityIds.has(r.fromId) || matchedEntityIds.has(r.toId)) &&
+        (!relTypeSet || relTypeSet.has(r.relationType.toLowerCase()))
+      ) {
+        matchedRelations.push(r);
+      }
+    }
   }
 
   // Get neighborhood if requested
@@ -227,18 +308,20 @@ export function searchGraph(
     neighborhoodRelations = neighborhood.relations;
   }
 
-  // Combine results
-  const allEntities = [...entityMatches.map((m) => m.entity), ...neighborhoodEntities];
-  const allRelations = [...matchedRelations, ...neighborhoodRelations];
-
-  // Deduplicate
+  // Combine and deduplicate results without building intermediate arrays
   const entityMap = new Map<EntityId, Entity>();
-  for (const e of allEntities) {
+  for (const m of entityMatches) {
+    entityMap.set(m.entity.id, m.entity);
+  }
+  for (const e of neighborhoodEntities) {
     entityMap.set(e.id, e);
   }
 
   const relationMap = new Map<string, Relation>();
-  for (const r of allRelations) {
+  for (const r of matchedRelations) {
+    relationMap.set(r.id, r);
+  }
+  for (const r of neighborhoodRelations) {
     relationMap.set(r.id, r);
   }
 
@@ -321,7 +404,7 @@ export function getEntityNeighborhood(
   entityId: EntityId,
   depth: 1 | 2
 ): NeighborhoodResult | null {
-  const centerEntity = snapshot.entities.find((e: Entity) => e.id === entityId);
+  const centerEntity = getEntityLookup(snapshot).byId.get(entityId);
   if (!centerEntity) {
     return null;
   }
@@ -344,6 +427,40 @@ export function getEntityNeighborhood(
 // Lookup Functions
 // ============================================================================
 
+/**
+ * Entity lookup tables for a snapshot
+ */
+interface EntityLookup {
+  byId: Map<EntityId, Entity>;
+  byName: Map<string, Entity>;
+  normalizedNames: string[];
+}
+
+// Keyed by snapshot identity: GraphStore hands out a new snapshot object
+// whenever the graph changes, so a stale lookup can never be observed.
+const entityLookupCache = new WeakMap<GraphSnapshot, EntityLookup>();
+
+/**
+ * Gets (building on first use) the id/name lookup tables for a snapshot
+ */
+function getEntityLookup(snapshot: GraphSnapshot): EntityLookup {
+  let lookup = entityLookupCache.get(snapshot);
+  if (!lookup) {
+    lookup = { byId: new Map(), byName: new Map(), normalizedNames: [] };
+    for (const entity of snapshot.entities) {
+      const normalized = normalizeName(entity.name);
+      lookup.byId.set(entity.id, entity);
+      // First entity wins, matching the previous linear-scan semantics
+      if (!lookup.byName.has(normalized)) {
+        lookup.byName.set(normalized, entity);
+      }
+      lookup.normalizedNames.push(normalized);
+    }
+    entityLookupCache.set(snapshot, lookup);
+  }
+  return lookup;
+}
+
 /**
  * Finds an entity by name or ID
  */
@@ -351,23 +468,97 @@ export function findEntity(
   snapshot: GraphSnapshot,
   nameOrId: string
 ): Entity | null {
+  const lookup = getEntityLookup(snapshot);
+
   // Try exact ID match first
-  const byId = snapshot.entities.find((e: Entity) => e.id === nameOrId);
+  const byId = lookup.byId.get(nameOrId as EntityId);
   if (byId) return byId;
 
   // Try exact name match
   const normalizedInput = normalizeName(nameOrId);
-  const byName = snapshot.entities.find(
-    (e: Entity) => normalizeName(e.name) === normalizedInput
-  );
+  const byName = lookup.byName.get(normalizedInput);
   if (byName) return byName;
 
   // Try partial name match
-  const byPartialName = snapshot.entities.find((e: Entity) =>
-    normalizeName(e.name).includes(normalizedInput)
+  const partialIndex = lookup.normalizedNames.findIndex((name: string) =>
+    name.includes(normalizedInput)
   );
 
-  return byPartialName ?? null;
+  return partialIndex >= 0 ? snapshot.entities[partialIndex] : null;
+}
+
+// id -> item indexes keyed by collection identity. Snapshots share the
+// collections an event did not touch, so an index survives unrelated changes.
+const idIndexCache = new WeakMap<readonly { id: string }[], Map<string, { id: string }>>();
+
+/**
+ * Gets (building on first use) an id index over a snapshot collection
+ */
+function getIdIndex<T extends { id: string }>(items: readonly T[]): Map<string, T> {
+  let index = idIndexCache.get(items);
+  if (!index) {
+    index = new Map();
+    for (const item of items) {
+      // First item wins, matching Array#find
+      if (!index.has(item.id)) {
+        index.set(item.id, item);
+      }
+    }
+    idIndexCache.set(items, index);
+  }
+  return index as Map<string, T>;
+}
+
+/**
+ * Gets an observation by ID
+ */
+export function getObservationById(snapshot: GraphSnapshot, observationId: string): Observation | null {
+  return getIdIndex(snapshot.observations).get(observationId) ?? null;
+}
+
+/**
+ * Gets a relation by ID
+ */
+export function getRelationById(snapshot: GraphSnapshot, relationId: string): Relation | null {
+  return getIdIndex(snapshot.relations).get(relationId) ?? null;
+}
+
+/**
+ * Gets an entity's display name by ID, falling back to the ID itself
+ */
+export function getEntityName(snapshot: GraphSnapshot, entityId: EntityId): string {
+  return getEntityLookup(snapshot).byId.get(entityId)?.name ?? entityId;
+}
+
+// Observations grouped by entity (newest first), keyed by snapshot identity
+// like entityLookupCache
+const observationsByEntityCache = new WeakMap<GraphSnapshot, Map<EntityId, Observation[]>>();
+
+/**
+ * Gets (building on first use) every entity's observations for a snapshot.
+ * Callers usually ask for several entities in a row, so one pass over the
+ * observations replaces a full filter + sort per entity.
+ */
+function getObservationsByEntity(snapshot: GraphSnapshot): Map<EntityId, Observation[]> {
+  let byEntity = observationsByEntityCache.get(snapshot);
+  if (!byEntity) {
+    byEntity = new Map();
+    const timestamps = new Map<Observation, number>();
+    for (const obs of snapshot.observations as Observation[]) {
+      timestamps.set(obs, new Date(obs.timestamp).getTime());
+      const list = byEntity.get(obs.entityId);
+      if (list) {
+        list.push(obs);
+      } else {
+        byEntity.set(obs.entityId, [obs]);
+      }
+    }
+    for (const list of byEntity.values()) {
+      list.sort((a: Observation, b: Observation) => timestamps.get(b)! - timestamps.get(a)!);
+    }
+    observationsByEntityCache.set(snapshot, byEntity);
+  }
+  return byEntity;
 }
 
 /**
@@ -377,9 +568,8 @@ export function getEntityObservations(
   snapshot: GraphSnapshot,
   entityId: EntityId
 ): Observation[] {
-  return (snapshot.observations as Observation[])
-    .filter((o: Observation) => o.entityId === entityId)
-    .sort((a: Observation, b: Observation) => new Date(b.timestamp).getTime() - new Date(a.timestamp).getTime());
+  const observations = getObservationsByEntity(snapshot).get(entityId);
+  return observations ? [...observations] : [];
 }
 
 /**
@@ -11,6 +11,7 @@
  * - Generate Markdown representation
  */
 
+import type { Hash } from 'crypto';
 import type { FileSystemInterface } from '../../utils/storage/FileSystemInterface.js';
 import type {
   Entity,
@@ -44,12 +45,16 @@ import {
   validateRelationInput,
 } from './GraphSchemas.js';
 import {
+  applyEventToSnapshot,
+  applyJsonlToSnapshot,
   calculateStats,
   reduceJsonlToSnapshot,
   getEventLineCount,
 } from './GraphReducer.js';
 import {
   findEntity,
+  getObservationById,
+  getRelationById,
 } from './GraphSearch.js';
 import { renderGraphToMarkdown } from './GraphRenderer.js';
 import { ETagUtils } from '../../utils/ETagUtils.js';
@@ -66,14 +71,41 @@ export class GraphStore {
   private readonly storeRoot: string;
   private readonly storeId: string;
 
+  // Graph file locations, resolved once against storeRoot
+  private readonly graphDir: string;
+  private readonly jsonlPath: string;
+  private readonly snapshotPath: string;
+  private readonly markdownPath: string;
+  private readonly indexPath: string;
+
   // In-memory cache for performance
   private cachedSnapshot: GraphSnapshot | null = null;
   private cachedIndex: GraphIndex | null = null;
   private lastJsonlEtag: string | null = null;
+  // Running hash of that content, extended with our own appends so the ETag
+  // always describes bytes we know are in the file
+  private jsonlHash: Hash | null = null;
+  // Length of the JSONL content the cached snapshot was built from. Used as a
+  // cheap validator before hashing: a length change alone proves staleness.
+  private lastJsonlLength: number | null = null;
+  // Set when appended events were applied to the cached snapshot in memory
+  // but the snapshot/markdown/index files have not been rewritten yet.
+  private viewsDirty = false;
+
+  // In-flight getSnapshot() call, shared by overlapping readers. It is only
+  // joined while writeGeneration is unchanged, so a reader never receives a
+  // snapshot that predates one of its own writes.
+  private pendingSnapshot: Promise<GraphOperationResult<GraphSnapshot>> | null = null;
+  private pendingGeneration = 0;
+  private writeGeneration = 0;
 
   // Async write queue to prevent concurrent write race conditions
   private writeQueue: Promise<void> = Promise.resolve();
 
+  // Tail of the view (snapshot/Markdown/index) writes. Each write waits for
+  // the previous one, so an older snapshot can never land after a newer one.
+  private viewWrites: Promise<void> = Promise.resolve();
+
   // Cached marker validation: once the marker is verified during
   // initialize() or the first append, skip re-reading the whole file
   // on subsequent appends.
@@ -83,6 +115,11 @@ export class GraphStore {
     this.fs = fs;
     this.storeRoot = storeRoot;
     this.storeId = storeId;
+    this.graphDir = this.resolvePath(GP.DIR);
+    this.jsonlPath = this.resolvePath(GP.JSONL);
+    this.snapshotPath = this.resolvePath(GP.SNAPSHOT);
+    this.markdownPath = this.resolvePath(GP.MARKDOWN);
+    this.indexPath = this.resolvePath(GP.INDEX);
   }
 
   /**
@@ -106,24 +143,11 @@ export class GraphStore {
   // Path Helpers
   // ==========================================================================
 
-  private get graphDir(): string {
-    return this.storeRoot ? `${this.storeRoot}/${GP.DIR}` : GP.DIR;
-  }
-
-  private get jsonlPath(): string {
-    return this.storeRoot ? `${this.storeRoot}/${GP.JSONL}` : GP.JSONL;
-  }
-
-  private get snapshotPath(): string {
-    return this.storeRoot ? `${this.storeRoot}/${GP.SNAPSHOT}` : GP.SNAPSHOT;
-  }
-
-  private get markdownPath(): string {
-    return this.storeRoot ? `${this.storeRoot}/${GP.MARKDOWN}` : GP.MARKDOWN;
-  }
-
-  private get indexPath(): string {
-    return this.storeRoot ? `${this.storeRoot}/${GP.INDEX}` : GP.INDEX;
+  /**
+   * Resolves a graph file path relative to the store root
+   */
+  private resolvePath(relativePath: string): string {
+    return this.storeRoot ? `${this.storeRoot}/${relativePath}` : relativePath;
   }
 
   // ==========================================================================
@@ -254,10 +278,29 @@ export class GraphStore {
         // Append only the new event line — no read-modify-write
         const eventLine = JSON.stringify(event) + '\n';
         await this.fs.appendFile(this.jsonlPath, eventLine);
-
-        // Invalidate cache
-        this.cachedSnapshot = null;
-        this.cachedIndex = null;
+        this.writeGeneration++;
+
+        if (this.cachedSnapshot && this.cachedIndex && this.lastJsonlLength !== null) {
+          // Fold the event into the cached snapshot instead of replaying the
+          // whole log, and extend the ETag with exactly the appended line
+          this.cachedSnapshot = applyEventToSnapshot(this.cachedSnapshot, event);
+          this.cachedIndex = {
+            ...this.cachedIndex,
+            lastEventLineCount: this.cachedIndex.lastEventLineCount + 1,
+          };
+          this.lastJsonlLength += eventLine.length;
+          if (this.jsonlHash) {
+            this.jsonlHash.update(eventLine);
+            this.lastJsonlEtag = ETagUtils.etagOf(this.jsonlHash);
+          } else {
+            this.lastJsonlEtag = null;
+          }
+          this.viewsDirty = true;
+        } else {
+          // Invalidate cache
+          this.cachedSnapshot = null;
+          this.cachedIndex = null;
+        }
 
         return { success: true, data: undefined };
       } catch (error) {
@@ -409,9 +452,7 @@ export class GraphStore {
     }
 
     // Find the observation
-    const observation = snapshot.data.observations.find(
-      (o: Observation) => o.id === observationId
-    );
+    const observation = getObservationById(snapshot.data, observationId);
     if (!observation) {
       return { success: false, error: `Observation not found: ${observationId}`, code: 'ENTITY_NOT_FOUND' };
     }
@@ -469,7 +510,7 @@ export class GraphStore {
     const id = createRelationId(fromEntity.id, toEntity.id, relationType);
 
     // Check if relation already exists (idempotent)
-    const existingRelation = snapshot.data.relations.find((r: Relation) => r.id === id);
+    const existingRelation = getRelationById(snapshot.data, id);
     if (existingRelation) {
       return { success: true, data: existingRelation };
     }
@@ -523,7 +564,7 @@ export class GraphStore {
     const relationId = createRelationId(fromEntity.id, toEntity.id, relationType);
 
     // Check if relation exists
-    const existingRelation = snapshot.data.relations.find((r: Relation) => r.id === relationId);
+    const existingRelation = getRelationById(snapshot.data, relationId);
     if (!existingRelation) {
       return { success: true, data: undefined }; // Idempotent - no-op if doesn't exist
     }
@@ -552,14 +593,46 @@ export class GraphStore {
 
   /**
    * Gets the current snapshot, rebuilding if necessary
+   *
+   * Overlapping calls share a single freshness check (and rebuild), so a
+   * burst of reads costs one read of the JSONL instead of one per caller.
+   */
+  getSnapshot(): Promise<GraphOperationResult<GraphSnapshot>> {
+    if (this.pendingSnapshot && this.pendingGeneration === this.writeGeneration) {
+      return this.pendingSnapshot;
+    }
+
+    const pending = this.loadSnapshot().finally(() => {
+      if (this.pendingSnapshot === pending) {
+        this.pendingSnapshot = null;
+      }
+    });
+    this.pendingSnapshot = pending;
+    this.pendingGeneration = this.writeGeneration;
+    return pending;
+  }
+
+  /**
+   * Loads the snapshot from cache, disk or a replay of the JSONL
    */
-  async getSnapshot(): Promise<GraphOperationResult<GraphSnapshot>> {
+  private async loadSnapshot(): Promise<GraphOperationResult<GraphSnapshot>> {
     try {
       // Fast path: cached and no changes
       if (this.cachedSnapshot && !(await this.checkNeedsRebuild())) {
+        if (this.viewsDirty && this.cachedIndex) {
+          await this.writeViews(this.cachedSnapshot, this.cachedIndex.lastEventLineCount);
+        }
         return { success: true, data: this.cachedSnapshot };
       }
 
+      // Another writer appended to the log: apply just the new lines
+      if (this.cachedSnapshot) {
+        const caughtUp = await this.tryApplyAppendedEvents();
+        if (caughtUp) {
+          return { success: true, data: caughtUp };
+        }
+      }
+
       // Cold start optimization: if snapshot file exists AND index shows
       // it's up-to-date with the JSONL, read snapshot from disk instead
       // of doing a full JSONL replay.
@@ -619,7 +692,7 @@ export class GraphStore {
       // Populate caches
       this.cachedSnapshot = snapshot;
       this.cachedIndex = index;
-      this.lastJsonlEtag = ETagUtils.calculateETag(jsonlContent);
+      this.trackJsonl(jsonlContent);
 
       logger.info('GraphStore', 'Loaded snapshot from disk (index indicated fresh)');
       return snapshot;
@@ -628,6 +701,54 @@ export class GraphStore {
     }
   }
 
+  /**
+   * Catches the cached snapshot up with events another writer appended to
+   * the JSONL, parsing only the new lines instead of replaying the whole log.
+   * Returns null when the log was rewritten rather than appended to, so the
+   * caller falls back to a full rebuild.
+   */
+  private async tryApplyAppendedEvents(): Promise<GraphSnapshot | null> {
+    if (!this.cachedSnapshot || !this.cachedIndex || this.lastJsonlLength === null || this.lastJsonlEtag === null) {
+      return null;
+    }
+
+    try {
+      const jsonlContent = await this.fs.readFile(this.jsonlPath);
+      const previousLength = this.lastJsonlLength;
+
+      // The previously seen content must be an unchanged, complete-line prefix
+      if (jsonlContent.length <= previousLength || jsonlContent[previousLength - 1] !== '\n') {
+        return null;
+      }
+      if (ETagUtils.calculateETag(jsonlContent.slice(0, previousLength)) !== this.lastJsonlEtag) {
+        return null;
+      }
+
+      const applied = applyJsonlToSnapshot(this.cachedSnapshot, jsonlContent.slice(previousLength));
+      if (!applied) {
+        return null;
+      }
+
+      this.cachedSnapshot = applied.snapshot;
+      this.trackJsonl(jsonlContent);
+      await this.writeViews(applied.snapshot, this.cachedIndex.lastEventLineCount + applied.lineCount);
+
+      logger.info('GraphStore', `Applied ${applied.lineCount} appended event(s) to cached snapshot`);
+      return applied.snapshot;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Records the JSONL content the cached snapshot was built from
+   */
+  private trackJsonl(jsonlContent: string): void {
+    this.jsonlHash = ETagUtils.createRunningHash(jsonlContent);
+    this.lastJsonlEtag = ETagUtils.etagOf(this.jsonlHash);
+    this.lastJsonlLength = jsonlContent.length;
+  }
+
   /**
    * Checks if snapshot needs rebuilding
    */
@@ -637,13 +758,16 @@ export class GraphStore {
 
       // Check if JSONL has changed
       const jsonlContent = await this.fs.readFile(this.jsonlPath);
-      const currentEtag = ETagUtils.calculateETag(jsonlContent);
-
-      if (this.lastJsonlEtag !== currentEtag) {
+      if (this.lastJsonlLength !== null && jsonlContent.length !== this.lastJsonlLength) {
         return true;
       }
 
-      return false;
+      // Same length is not enough: another writer may have rewritten the
+      // file. The tracked ETag covers the bytes we read plus our appends.
+      if (this.lastJsonlEtag === null) {
+        return true;
+      }
+      return ETagUtils.calculateETag(jsonlContent) !== this.lastJsonlEtag;
     } catch {
       return true;
     }
@@ -662,32 +786,10 @@ export class GraphStore {
       }
 
       this.cachedSnapshot = result.snapshot;
-      this.lastJsonlEtag = ETagUtils.calculateETag(jsonlContent);
+      this.trackJsonl(jsonlContent);
 
-      // Write snapshot file
-      await this.fs.writeFile(this.snapshotPath, JSON.stringify(result.snapshot, null, 2));
-
-      // Update Markdown view
-      const markdown = renderGraphToMarkdown(result.snapshot);
-      await this.fs.writeFile(this.markdownPath, markdown);
-
-      // Update index
-      const lineCount = getEventLineCount(jsonlContent);
-      const stats = calculateStats(result.snapshot);
-      const nameToEntityId: Record<string, string> = {};
-      for (const entity of result.snapshot.entities) {
-        nameToEntityId[normalizeName(entity.name)] = entity.id;
-      }
-
-      const index: GraphIndex = {
-        lastEventLineCount: lineCount,
-        snapshotBuiltAt: new Date().toISOString(),
-        jsonlModifiedAt: new Date().toISOString(),
-        stats,
-        nameToEntityId: nameToEntityId as Record<string, EntityId>,
-      };
-      this.cachedIndex = index;
-      await this.fs.writeFile(this.indexPath, JSON.stringify(index, null, 2));
+      const index = await this.writeViews(result.snapshot, getEventLineCount(jsonlContent));
+      const { stats } = index;
 
       logger.info('GraphStore', `Rebuilt snapshot: ${stats.entityCount} entities, ${stats.relationCount} relations`);
       return { success: true, data: result.snapshot };
@@ -698,6 +800,58 @@ export class GraphStore {
     }
   }
 
+  /**
+   * Writes the snapshot, Markdown view and index for a snapshot
+   * @param snapshot Snapshot to persist
+   * @param lineCount Number of event lines the snapshot reflects
+   * @returns The index that was written
+   */
+  private async writeViews(snapshot: GraphSnapshot, lineCount: number): Promise<GraphIndex> {
+    const stats = calculateStats(snapshot);
+    const nameToEntityId: Record<string, string> = {};
+    for (const entity of snapshot.entities) {
+      nameToEntityId[normalizeName(entity.name)] = entity.id;
+    }
+
+    const index: GraphIndex = {
+      lastEventLineCount: lineCount,
+      snapshotBuiltAt: new Date().toISOString(),
+      jsonlModifiedAt: new Date().toISOString(),
+      stats,
+      nameToEntityId: nameToEntityId as Record<string, EntityId>,
+    };
+    this.cachedIndex = index;
+
+    // Snapshot and Markdown are independent — write them concurrently so the
+    // caller doesn't wait on back-to-back I/O (each write is an SSH round-trip
+    // for remote stores). The index goes last: it is what marks the snapshot
+    // file as fresh for the cold-start path. The snapshot is a machine-read
+    // cache that grows with the graph, so it is written without indentation;
+    // graph.md is the human-readable view.
+    //
+    //
+    // The dirty flag is cleared before writing: an event appended while the
+    // writes are in flight sets it again, so its views are not lost. Writes
+    // are queued behind earlier ones, so views always end on the newest call.
+    this.viewsDirty = false;
+    const write = this.viewWrites.then(async () => {
+      await Promise.all([
+        this.fs.writeFile(this.snapshotPath, JSON.stringify(snapshot)),
+        this.fs.writeFile(this.markdownPath, renderGraphToMarkdown(snapshot)),
+      ]);
+      await this.fs.writeFile(this.indexPath, JSON.stringify(index, null, 2));
+    });
+    this.viewWrites = write.catch(() => {});
+    try {
+      await write;
+    } catch (error) {
+      this.viewsDirty = true;
+      throw error;
+    }
+
+    return index;
+  }
+
   // ==========================================================================
   // Compaction
   // ==========================================================================
@@ -762,11 +916,15 @@ export class GraphStore {
       // Atomic write — replace the JSONL
       const compactedContent = lines.join('\n') + '\n';
       await this.fs.writeFile(this.jsonlPath, compactedContent);
+      this.writeGeneration++;
 
       // Invalidate caches so next getSnapshot() reads the compacted file
       this.cachedSnapshot = null;
       this.cachedIndex = null;
       this.lastJsonlEtag = null;
+      this.jsonlHash = null;
+      this.lastJsonlLength = null;
+      this.viewsDirty = false;
 
       // Rebuild index to match the new file
       await this.rebuildSnapshot();
@@ -798,6 +956,23 @@ export class GraphStore {
     return { success: true, data: calculateStats(snapshot.data) };
   }
 
+  /**
+   * Writes the snapshot, Markdown view and index if events applied in memory
+   * are not reflected in them yet
+   */
+  async flushViews(): Promise<GraphOperationResult<void>> {
+    try {
+      if (this.viewsDirty && this.cachedSnapshot && this.cachedIndex) {
+        await this.writeViews(this.cachedSnapshot, this.cachedIndex.lastEventLineCount);
+      }
+      return { success: true, data: undefined };
+    } catch (error) {
+      const message = error instanceof Error ? error.message : String(error);
+      logger.error('GraphStore', `Failed to write views: ${message}`);
+      return { success: false, error: message, code: 'IO_ERROR' };
+    }
+  }
+
   /**
    * Gets the Markdown representation
    */
@@ -823,9 +998,13 @@ export class GraphStore {
    * Clears the in-memory cache
    */
   clearCache(): void {
+    this.writeGeneration++;
     this.cachedSnapshot = null;
     this.cachedIndex = null;
     this.lastJsonlEtag = null;
+    this.jsonlHash = null;
+    this.lastJsonlLength = null;
+    this.viewsDirty = false;
   }
 }
 
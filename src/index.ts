@@ -2,45 +2,16 @@
 // Reference Node.js types
 /// <reference types="node" />
 
-import { MemoryBankServer } from './server/MemoryBankServer.js';
+import { MemoryBankServer, PKG_VERSION } from './server/MemoryBankServer.js';
 import { getLogManager, logger, LogLevel } from './utils/LogManager.js';
 import { FileSystemFactory } from './utils/storage/FileSystemFactory.js';
-import { readFileSync } from 'fs';
-import { join, dirname } from 'path';
-import { fileURLToPath } from 'url';
-
-// Get directory name in ESM
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = dirname(__filename);
-
 /**
  * Display startup banner with version information
  */
 function displayBanner(): void {
   try {
-    // Read version from package.json
-    // Resolve path from current directory (works in both development and production)
-    let packageJson: any;
-    let version = 'unknown';
-    
-    try {
-      // Try build/ location first (production)
-      const packageJsonPath = join(__dirname, '..', 'package.json');
-      const content = readFileSync(packageJsonPath, 'utf-8') as string;
-      packageJson = JSON.parse(content);
-      version = packageJson.version || 'unknown';
-    } catch {
-      try {
-        // If not found, try from src/ location (development)
-        const packageJsonPath = join(__dirname, '..', '..', 'package.json');
-        const content = readFileSync(packageJsonPath, 'utf-8') as string;
-        packageJson = JSON.parse(content);
-        version = packageJson.version || 'unknown';
-      } catch {
-        // If still not found, use 'unknown'
-        version = 'unknown';
-      }
-    }
+    // Version is resolved once when the server module loads
+    const version = PKG_VERSION;
 
     const banner = `
 ╭──────────────────────────────────────────────────────────────────────────────╮
@@ -6,10 +6,12 @@
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { MemoryBankManager } from '../core/MemoryBankManager.js';
+import { StoreRegistry } from '../core/StoreRegistry.js';
 import { ProgressTracker } from '../core/ProgressTracker.js';
 import { setupToolHandlers } from './tools/index.js';
 import { setupResourceHandlers } from './resources/index.js';
 import { ModeManagerEvent } from '../utils/ModeManager.js';
+import { SshUtils } from '../utils/SshUtils.js';
 import { createRequire } from 'module';
 import { readFileSync } from 'fs';
 import { join, dirname } from 'path';
@@ -21,6 +23,7 @@ const __dirname = dirname(__filename);
 
 // Read the canonical version from package.json at startup so the MCP
 // handshake always reports the same version as `npm pkg get version`.
+// Read once and shared (e.g. with the CLI banner) via PKG_VERSION.
 function getVersion(): string {
   try {
     // Try using createRequire first (works in development)
@@ -41,7 +44,7 @@ function getVersion(): string {
   }
 }
 
-const PKG_VERSION: string = getVersion();
+export const PKG_VERSION: string = getVersion();
 
 /**
  * Main MCP server class for Memory Bank
@@ -200,6 +203,14 @@ export class MemoryBankServer {
         modeManager.dispose();
       }
       
+      // Persist store lastUsedAt updates still waiting on the coalescing timer
+      await StoreRegistry.getInstance().flush().catch((error) => {
+        console.error('Failed to save store registry:', error);
+      });
+
+      // Stop any multiplexed SSH master connections used by a remote bank
+      await SshUtils.closeAllConnections();
+
       await this.server.close();
       this.isRunning = false;
       console.error('Memory Bank server shut down successfully');
@@ -1,16 +1,20 @@
 import path from 'path';
 import { MemoryBankManager } from '../../core/MemoryBankManager.js';
-import { MigrationUtils } from '../../utils/MigrationUtils.js';
 import { FileUtils } from '../../utils/FileUtils.js';
 import { ETagUtils } from '../../utils/ETagUtils.js';
-import { GraphStore } from '../../core/graph/GraphStore.js';
+import { SshUtils } from '../../utils/SshUtils.js';
 import { renderGraphSummary } from '../../core/graph/GraphRenderer.js';
-import { LocalFileSystem } from '../../utils/storage/LocalFileSystem.js';
+import { getGraphStore } from './GraphTools.js';
 import { LogManager } from '../../utils/LogManager.js';
 import os from 'os';
 
 const logger = LogManager.getInstance();
 
+/**
+ * Number of backups create_backup lists when no valid limit is given
+ */
+const DEFAULT_BACKUP_LIST_LIMIT = 20;
+
 /**
  * Definition of the main Memory Bank tools
  */
@@ -218,6 +222,12 @@ export const coreTools = [
           type: 'boolean',
           description: 'If true, lists existing backups instead of creating a new one',
         },
+        limit: {
+          type: 'integer',
+          description: 'Maximum number of backups to list when listOnly is true, newest first (default: 20)',
+          minimum: 1,
+          default: 20,
+        },
       },
       additionalProperties: false,
     },
@@ -370,13 +380,10 @@ export const coreTools = [
 ];
 
 /**
- * Returns comprehensive instructions for using the Memory Bank MCP server.
- * This is the canonical entry point — call it FIRST in every session.
- *
- * The instructions are static and require no initialized Memory Bank.
+ * Usage instructions returned by get_instructions. The text is static and
+ * defined once at module level; the handler only wraps it in a response.
  */
-export function handleGetInstructions() {
-  const instructions = `# Memory Bank MCP Server — Instructions
+const INSTRUCTIONS = `# Memory Bank MCP Server — Instructions
 
 ## What is Memory Bank?
 Memory Bank is an MCP server that persists project context across AI sessions.
@@ -436,7 +443,7 @@ These files live in the \`memory-bank/\` directory:
 |------|---------|
 | \`get_context_digest\` | Compact summary: recent progress, tasks, issues, decisions, graph overview |
 | \`get_context_bundle\` | Full content of ALL core files in one response (larger payload) |
-| \`get_memory_bank_status\` | Status of the Memory Bank (initialized, path, file list) |
+| \`get_memory_bank_status\` | Status of the Memory Bank (initialized, path, file list, SSH session usage for remote banks) |
 | \`list_memory_bank_files\` | List all files in the Memory Bank directory |
 | \`search_memory_bank\` | Full-text search across all Memory Bank files |
 
@@ -512,11 +519,18 @@ These files live in the \`memory-bank/\` directory:
 7. \`track_progress\` — final summary of accomplishments
 `;
 
+/**
+ * Returns comprehensive instructions for using the Memory Bank MCP server.
+ * This is the canonical entry point — call it FIRST in every session.
+ *
+ * The instructions are static and require no initialized Memory Bank.
+ */
+export function handleGetInstructions() {
   return {
     content: [
       {
         type: 'text',
-        text: instructions,
+        text: INSTRUCTIONS,
       },
     ],
   };
@@ -857,11 +871,15 @@ export async function handleGetMemoryBankStatus(
   try {
     const status = await memoryBankManager.getStatus();
 
+    // Remote banks: report SSH session usage, so a MEMORY_BANK_SSH_MAX_SESSIONS
+    // limit that queues commands is visible
+    const sshConnections = SshUtils.getConnectionStats();
+
     return {
       content: [
         {
           type: 'text',
-          text: JSON.stringify(status, null, 2),
+          text: JSON.stringify(sshConnections.length > 0 ? { ...status, sshConnections } : status, null, 2),
         },
       ],
     };
@@ -1053,18 +1071,24 @@ export async function handleGetContextBundle(
     const bundle: Record<string, { content: string; etag?: string }> = {};
     const errors: string[] = [];
 
-    for (const filename of CORE_FILES) {
-      try {
-        const content = await memoryBankManager.readFile(filename);
+    // Read all core files in parallel, then assemble in CORE_FILES order
+    const reads = await Promise.allSettled(
+      CORE_FILES.map((filename) => memoryBankManager.readFile(filename))
+    );
+
+    reads.forEach((result, i) => {
+      const filename = CORE_FILES[i];
+      if (result.status === 'fulfilled') {
+        const content = result.value;
         bundle[filename] = {
           content,
           ...(includeEtags && { etag: ETagUtils.calculateETag(content) }),
         };
-      } catch (error) {
+      } else {
         // File might not exist yet, which is OK
-        errors.push(`${filename}: ${error}`);
+        errors.push(`${filename}: ${result.reason}`);
       }
-    }
+    });
 
     // Count successfully loaded files
     const loadedCount = Object.keys(bundle).length;
@@ -1125,8 +1149,9 @@ function extractProgressEntries(content: string, maxEntries: number): string[] {
   
   for (const line of lines) {
     // Progress entries start with "- [" followed by a date/time
-    if (line.trim().startsWith('- [') && /\d{4}-\d{2}-\d{2}/.test(line)) {
-      entries.push(line.trim());
+    const trimmed = line.trim();
+    if (trimmed.startsWith('- [') && /\d{4}-\d{2}-\d{2}/.test(trimmed)) {
+      entries.push(trimmed);
       if (entries.length >= maxEntries) {
         break;
       }
@@ -1136,6 +1161,10 @@ function extractProgressEntries(content: string, maxEntries: number): string[] {
   return entries;
 }
 
+/** Field labels read from decision-log.md entries */
+const DATE_LABEL = '**Date:**';
+const DECISION_LABEL = '**Decision:**';
+
 /**
  * Extracts decisions from the decision-log.md content
  * 
@@ -1156,11 +1185,16 @@ function extractDecisions(content: string, maxDecisions: number): Array<{ title:
     let date: string | undefined;
     let summary = '';
     
-    for (const line of lines.slice(1)) {
-      if (line.includes('**Date:**')) {
-        date = line.replace(/.*\*\*Date:\*\*\s*/, '').trim();
-      } else if (line.includes('**Decision:**')) {
-        summary = line.replace(/.*\*\*Decision:\*\*\s*/, '').trim();
+    for (let j = 1; j < lines.length; j++) {
+      const line = lines[j];
+      const dateIndex = line.lastIndexOf(DATE_LABEL);
+      if (dateIndex !== -1) {
+        date = line.slice(dateIndex + DATE_LABEL.length).trim();
+        continue;
+      }
+      const decisionIndex = line.lastIndexOf(DECISION_LABEL);
+      if (decisionIndex !== -1) {
+        summary = line.slice(decisionIndex + DECISION_LABEL.length).trim();
       }
     }
     
@@ -1259,9 +1293,18 @@ export async function handleGetContextDigest(
       recentDecisions: [],
     };
 
+    // Read the source files in parallel (each read is an SSH round-trip for
+    // remote banks), then extract from each in turn
+    const [activeContextRead, progressRead, decisionLogRead, systemPatternsRead] = await Promise.allSettled([
+      memoryBankManager.readFile('active-context.md'),
+      memoryBankManager.readFile('progress.md'),
+      memoryBankManager.readFile('decision-log.md'),
+      includeSystemPatterns ? memoryBankManager.readFile('system-patterns.md') : Promise.resolve(null),
+    ]);
+
     // Load active context
-    try {
-      const activeContext = await memoryBankManager.readFile('active-context.md');
+    if (activeContextRead.status === 'fulfilled') {
+      const activeContext = activeContextRead.value;
       
       // Extract project state (first paragraph after # Active Context)
       const projectStateMatch = activeContext.match(/## Current Project State\s+([\s\S]*?)(?=##|$)/);
@@ -1271,36 +1314,33 @@ export async function handleGetContextDigest(
       
       // Extract tasks, issues, and next steps
       digest.currentContext = extractActiveContextItems(activeContext);
-    } catch (error) {
-      console.error('Error loading active-context.md:', error);
+    } else {
+      console.error('Error loading active-context.md:', activeContextRead.reason);
     }
 
     // Load recent progress
-    try {
-      const progress = await memoryBankManager.readFile('progress.md');
-      digest.recentProgress = extractProgressEntries(progress, maxProgressEntries);
-    } catch (error) {
-      console.error('Error loading progress.md:', error);
+    if (progressRead.status === 'fulfilled') {
+      digest.recentProgress = extractProgressEntries(progressRead.value, maxProgressEntries);
+    } else {
+      console.error('Error loading progress.md:', progressRead.reason);
     }
 
     // Load recent decisions
-    try {
-      const decisionLog = await memoryBankManager.readFile('decision-log.md');
-      digest.recentDecisions = extractDecisions(decisionLog, maxDecisions);
-    } catch (error) {
-      console.error('Error loading decision-log.md:', error);
+    if (decisionLogRead.status === 'fulfilled') {
+      digest.recentDecisions = extractDecisions(decisionLogRead.value, maxDecisions);
+    } else {
+      console.error('Error loading decision-log.md:', decisionLogRead.reason);
     }
 
     // Optionally load system patterns summary
-    if (includeSystemPatterns) {
-      try {
-        const systemPatterns = await memoryBankManager.readFile('system-patterns.md');
+    if (systemPatternsRead.status === 'fulfilled') {
+      if (systemPatternsRead.value !== null) {
         // Just include first few lines as a summary
-        const lines = systemPatterns.split('\n').slice(0, 20);
+        const lines = systemPatternsRead.value.split('\n').slice(0, 20);
         digest.systemPatterns = lines.join('\n');
-      } catch (error) {
-        console.error('Error loading system-patterns.md:', error);
       }
+    } else {
+      console.error('Error loading system-patterns.md:', systemPatternsRead.reason);
     }
 
     // Load knowledge graph summary if the graph exists
@@ -1308,11 +1348,9 @@ export async function handleGetContextDigest(
       const graphJsonlPath = path.join(memoryBankDir, 'graph', 'graph.jsonl');
       const graphExists = await FileUtils.fileExists(graphJsonlPath);
       if (graphExists) {
-        const fs = new LocalFileSystem(memoryBankDir);
-        const storeId = path.basename(memoryBankDir);
-        const graphStore = new GraphStore(fs, '', storeId);
-        const initResult = await graphStore.initialize();
-        if (initResult.success) {
+        // Reuse the cached store so repeated digests don't replay the event log
+        const graphStore = await getGraphStore(memoryBankManager);
+        if (graphStore) {
           const snapshotResult = await graphStore.getSnapshot();
           if (snapshotResult.success) {
             digest.graphSummary = renderGraphSummary(snapshotResult.data);
@@ -1410,37 +1448,45 @@ export async function handleSearchMemoryBank(
     const results: SearchResult[] = [];
     const searchQuery = caseSensitive ? query : query.toLowerCase();
 
-    for (const filename of filesToSearch) {
+    // Read every file concurrently (each read is an SSH round-trip on remote
+    // banks), then scan them in order so results stay deterministic
+    const reads = await Promise.allSettled(
+      filesToSearch.map(filename => memoryBankManager.readFile(filename))
+    );
+
+    for (let f = 0; f < filesToSearch.length; f++) {
       if (results.length >= maxResults) break;
 
-      try {
-        const content = await memoryBankManager.readFile(filename);
-        const lines = content.split('\n');
-
-        for (let i = 0; i < lines.length; i++) {
-          if (results.length >= maxResults) break;
-
-          const line = lines[i];
-          const searchLine = caseSensitive ? line : line.toLowerCase();
-
-          if (searchLine.includes(searchQuery)) {
-            // Get context (1 line before and after)
-            const contextLines: string[] = [];
-            if (i > 0) contextLines.push(lines[i - 1]);
-            contextLines.push(line);
-            if (i < lines.length - 1) contextLines.push(lines[i + 1]);
-
-            results.push({
-              file: filename,
-              line: i + 1,
-              content: line.trim(),
-              context: contextLines.join('\n'),
-            });
-          }
-        }
-      } catch (error) {
+      const filename = filesToSearch[f];
+      const read = reads[f];
+      if (read.status === 'rejected') {
         // File might not exist, skip it
-        console.error(`Error searching ${filename}:`, error);
+        console.error(`Error searching ${filename}:`, read.reason);
+        continue;
+      }
+
+      const lines = read.value.split('\n');
+
+      for (let i = 0; i < lines.length; i++) {
+        if (results.length >= maxResults) break;
+
+        const line = lines[i];
+        const searchLine = caseSensitive ? line : line.toLowerCase();
+
+        if (searchLine.includes(searchQuery)) {
+          // Get context (1 line before and after)
+          const contextLines: string[] = [];
+          if (i > 0) contextLines.push(lines[i - 1]);
+          contextLines.push(line);
+          if (i < lines.length - 1) contextLines.push(lines[i + 1]);
+
+          results.push({
+            file: filename,
+            line: i + 1,
+            content: line.trim(),
+            context: contextLines.join('\n'),
+          });
+        }
       }
     }
 
@@ -1484,12 +1530,14 @@ export async function handleSearchMemoryBank(
  * @param memoryBankManager Memory Bank Manager instance
  * @param backupDir Optional custom backup directory
  * @param listOnly If true, lists backups instead of creating one
+ * @param limit Maximum number of backups to list; invalid values fall back to 20
  * @returns Operation result with backup path or list
  */
 export async function handleCreateBackup(
   memoryBankManager: MemoryBankManager,
   backupDir?: string,
-  listOnly?: boolean
+  listOnly?: boolean,
+  limit: unknown = DEFAULT_BACKUP_LIST_LIMIT
 ) {
   try {
     const memoryBankDirCheck = memoryBankManager.getMemoryBankDir();
@@ -1507,7 +1555,12 @@ export async function handleCreateBackup(
 
     // Handle listOnly mode
     if (listOnly) {
-      const backups = await memoryBankManager.listBackups();
+      // Clamp to a positive integer: tool arguments are not schema-checked,
+      // and 0, NaN or a string would return nothing or disable the cap
+      const maxBackups = typeof limit === 'number' && Number.isFinite(limit) && limit >= 1
+        ? Math.floor(limit)
+        : DEFAULT_BACKUP_LIST_LIMIT;
+      const backups = await memoryBankManager.listBackups(maxBackups);
       return {
         content: [
           {
@@ -1516,6 +1569,7 @@ export async function handleCreateBackup(
               backups,
               metadata: {
                 count: backups.length,
+                limit: maxBackups,
                 timestamp: new Date().toISOString(),
               },
             }, null, 2),
@@ -13,7 +13,7 @@
 
 import { MemoryBankManager } from '../../core/MemoryBankManager.js';
 import { GraphStore } from '../../core/graph/GraphStore.js';
-import { searchGraph, expandNeighborhood, findEntity, getEntityObservations } from '../../core/graph/GraphSearch.js';
+import { searchGraph, expandNeighborhood, findEntity, getEntityObservations, getEntityName } from '../../core/graph/GraphSearch.js';
 import { StoreRegistry } from '../../core/StoreRegistry.js';
 import { LogManager } from '../../utils/LogManager.js';
 
@@ -220,17 +220,11 @@ export const graphTools = [
 // Store Management
 // ============================================================================
 
-/** Cache of GraphStore instances by memory bank path */
-const storeCache = new Map<string, GraphStore>();
-
-/** Singleton store registry */
-let _storeRegistry: StoreRegistry | null = null;
-function getStoreRegistry(): StoreRegistry {
-  if (!_storeRegistry) {
-    _storeRegistry = new StoreRegistry();
-  }
-  return _storeRegistry;
-}
+/**
+ * Cache of GraphStore instances by memory bank path. The pending promise is
+ * cached so concurrent first calls share one store and one initialize().
+ */
+const storeCache = new Map<string, Promise<GraphStore | null>>();
 
 /**
  * Gets or creates a GraphStore for the given memory bank manager.
@@ -238,11 +232,13 @@ function getStoreRegistry(): StoreRegistry {
  * If `storeId` is provided, resolves the store path from the registry
  * instead of using the active store from `memoryBankManager`.
  *
+ * Shared with KGContextTools so both tool sets operate on the same cached
+ * instance (and its in-memory snapshot) for a given memory bank.
+ *
  * TODO [integration-gap]: This always creates a LocalFileSystem-backed GraphStore.
  * In HTTP+Postgres mode, it should use PostgresGraphStore instead.
- * See also: KGContextTools.ts has a duplicate getGraphStore() with the same gap.
  */
-async function getGraphStore(
+export async function getGraphStore(
   memoryBankManager: MemoryBankManager,
   storeId?: string,
 ): Promise<GraphStore | null> {
@@ -250,7 +246,7 @@ async function getGraphStore(
 
   if (storeId) {
     // Resolve from registry
-    const registry = getStoreRegistry();
+    const registry = StoreRegistry.getInstance();
     const projectPath = await registry.resolveStorePath(storeId);
     if (projectPath) {
       const folderName = memoryBankManager.getFolderName();
@@ -275,6 +271,20 @@ async function getGraphStore(
     return cached;
   }
 
+  const pending = createGraphStore(memoryBankDir, storeId);
+  storeCache.set(memoryBankDir, pending);
+  const store = await pending;
+  if (!store && storeCache.get(memoryBankDir) === pending) {
+    // Don't cache failures; the next call retries initialization
+    storeCache.delete(memoryBankDir);
+  }
+  return store;
+}
+
+/**
+ * Creates and initializes a GraphStore rooted at a memory bank directory
+ */
+async function createGraphStore(memoryBankDir: string, storeId?: string): Promise<GraphStore | null> {
   // Create new store — LocalFileSystem already has memoryBankDir as root,
   // so storeRoot must be empty to avoid double-path (memory-bank/memory-bank/graph/)
   const fs = new LocalFileSystem(memoryBankDir);
@@ -284,11 +294,10 @@ async function getGraphStore(
   // Initialize
   const initResult = await store.initialize();
   if (!initResult.success) {
-    console.error(`Failed to initialize GraphStore: ${initResult.error}`);
+    logger.error('GraphTools', `Failed to initialize GraphStore: ${initResult.error}`);
     return null;
   }
 
-  storeCache.set(memoryBankDir, store);
   return store;
 }
 
@@ -380,40 +389,6 @@ export async function handleGraphAddObservation(
     };
   }
 
-  // Resolve entity: could be name or ID
-  // Try as ID first (if it looks like an ID), otherwise treat as name
-  let entityId: EntityId;
-  if (entity.startsWith('ent_')) {
-    entityId = entity as EntityId;
-  } else {
-    // Look up by name
-    const snapshot = await store.getSnapshot();
-    if (!snapshot.success) {
-      return {
-        content: [
-          {
-            type: 'text',
-            text: `Failed to get snapshot: ${snapshot.error}`,
-          },
-        ],
-        isError: true,
-      };
-    }
-    const found = findEntity(snapshot.data, entity);
-    if (!found) {
-      return {
-        content: [
-          {
-            type: 'text',
-            text: `Entity not found: "${entity}". Create it first with graph_upsert_entity.`,
-          },
-        ],
-        isError: true,
-      };
-    }
-    entityId = found.id;
-  }
-
   // Convert string source to ObservationSource object
   // MCP tool sends source as a plain string (e.g., "manual", "tool", "agent")
   // but ObservationInput expects { kind: string, ref?: string }
@@ -421,8 +396,10 @@ export async function handleGraphAddObservation(
     ? { kind: source as 'manual' | 'tool' | 'import' | 'agent', ref: undefined }
     : undefined;
 
+  // The store resolves the entity (ID, exact name, then partial name)
+  // against its indexed snapshot, so no separate lookup is needed here
   const input: ObservationInput = {
-    entityRef: entityId,
+    entityRef: entity,
     text,
     source: observationSource,
     timestamp,
@@ -430,6 +407,18 @@ export async function handleGraphAddObservation(
 
   const result = await store.addObservation(input);
 
+  if (!result.success && result.code === 'ENTITY_NOT_FOUND') {
+    return {
+      content: [
+        {
+          type: 'text',
+          text: `Entity not found: "${entity}". Create it first with graph_upsert_entity.`,
+        },
+      ],
+      isError: true,
+    };
+  }
+
   if (!result.success) {
     return {
       content: [
@@ -649,18 +638,15 @@ export async function handleGraphSearch(
     neighborhoodDepth: neighborhoodDepth ?? 1,
   });
 
-  // Build entity ID → name map for relation display
-  const entityNameMap = new Map<string, string>();
-  for (const e of snapshot.data.entities) {
-    entityNameMap.set(e.id, e.name);
-  }
-
   // Map observations to their entities
   const entityObsMap = new Map<string, Array<{ text: string; timestamp: string }>>();
   for (const obs of searchResults.observations) {
-    const existing = entityObsMap.get(obs.entityId) ?? [];
+    let existing = entityObsMap.get(obs.entityId);
+    if (!existing) {
+      existing = [];
+      entityObsMap.set(obs.entityId, existing);
+    }
     existing.push({ text: obs.text, timestamp: obs.timestamp });
-    entityObsMap.set(obs.entityId, existing);
   }
 
   return {
@@ -682,12 +668,12 @@ export async function handleGraphSearch(
             observations: searchResults.observations.map(o => ({
               text: o.text,
               entityId: o.entityId,
-              entityName: entityNameMap.get(o.entityId) ?? o.entityId,
+              entityName: getEntityName(snapshot.data, o.entityId),
               timestamp: o.timestamp,
             })),
             relations: searchResults.relations.map(r => ({
-              from: entityNameMap.get(r.fromId) ?? r.fromId,
-              to: entityNameMap.get(r.toId) ?? r.toId,
+              from: getEntityName(snapshot.data, r.fromId),
+              to: getEntityName(snapshot.data, r.toId),
               relationType: r.relationType,
             })),
           },
@@ -816,7 +802,9 @@ export async function handleGraphDeleteEntity(
         isError: true,
       };
     }
-    await store.rebuildSnapshot();
+    // Update graph.md and the snapshot file right away, so deleted content
+    // does not linger in them until the next graph read
+    await store.flushViews();
     return {
       content: [
         {
@@ -843,8 +831,8 @@ export async function handleGraphDeleteEntity(
     };
   }
 
-  // Rebuild to update snapshot + markdown
-  await store.rebuildSnapshot();
+  // Update graph.md and the snapshot file right away (see above)
+  await store.flushViews();
 
   return {
     content: [
@@ -13,7 +13,7 @@
  */
 
 import { MemoryBankManager } from '../../core/MemoryBankManager.js';
-import { GraphStore } from '../../core/graph/GraphStore.js';
+import { getGraphStore } from './GraphTools.js';
 import {
   searchGraphDetailed,
   expandNeighborhood,
@@ -22,10 +22,7 @@ import {
 } from '../../core/graph/GraphSearch.js';
 import type { EntityMatch } from '../../core/graph/GraphSearch.js';
 import type { Entity, Observation, Relation, GraphSnapshot } from '../../types/graph.js';
-import { StoreRegistry } from '../../core/StoreRegistry.js';
-import { LocalFileSystem } from '../../utils/storage/LocalFileSystem.js';
 import { LogManager } from '../../utils/LogManager.js';
-import path from 'path';
 
 const logger = LogManager.getInstance();
 
@@ -151,62 +148,6 @@ export function excerptAroundMatches(
   return { excerpt: parts.join('\n'), truncated };
 }
 
-// ============================================================================
-// Shared: getGraphStore (duplicated from GraphTools to avoid circular deps)
-// TODO [integration-gap]: Same as GraphTools.getGraphStore() — always uses
-// LocalFileSystem. In HTTP+Postgres mode, should use PostgresGraphStore.
-// Both copies maintain separate storeCache Maps, which could cause
-// inconsistencies if both are called in the same process.
-// ============================================================================
-
-let storeRegistryInstance: StoreRegistry | null = null;
-function getStoreRegistry(): StoreRegistry {
-  if (!storeRegistryInstance) {
-    storeRegistryInstance = new StoreRegistry();
-  }
-  return storeRegistryInstance;
-}
-
-const storeCache = new Map<string, GraphStore>();
-
-async function getGraphStore(
-  memoryBankManager: MemoryBankManager,
-  storeId?: string
-): Promise<GraphStore | null> {
-  let memoryBankDir: string | null = null;
-
-  if (storeId) {
-    const registry = getStoreRegistry();
-    const projectPath = await registry.resolveStorePath(storeId);
-    if (projectPath) {
-      const folderName = memoryBankManager.getFolderName();
-      memoryBankDir = path.join(projectPath, folderName);
-      await registry.touchStore(storeId).catch(() => {});
-    }
-  }
-
-  if (!memoryBankDir) {
-    memoryBankDir = memoryBankManager.getMemoryBankDir();
-  }
-
-  if (!memoryBankDir) return null;
-
-  const cached = storeCache.get(memoryBankDir);
-  if (cached) return cached;
-
-  const fs = new LocalFileSystem(memoryBankDir);
-  const resolvedStoreId = storeId ?? path.basename(memoryBankDir);
-  const store = new GraphStore(fs, '', resolvedStoreId);
-  const initResult = await store.initialize();
-  if (!initResult.success) {
-    logger.error('KGContextTools', `Failed to initialize GraphStore: ${initResult.error}`);
-    return null;
-  }
-
-  storeCache.set(memoryBankDir, store);
-  return store;
-}
-
 // ============================================================================
 // Tool Definitions
 // ============================================================================
@@ -291,6 +232,11 @@ export const kgContextTools = [
 // Internal: Compact Digest Builder
 // ============================================================================
 
+// Section patterns: heading followed by its body up to the next heading
+const TASKS_SECTION = /## (?:Ongoing )?Tasks\s+([\s\S]*?)(?=##|$)/;
+const ISSUES_SECTION = /## (?:Known )?Issues\s+([\s\S]*?)(?=##|$)/;
+const NEXT_STEPS_SECTION = /## Next Steps\s+([\s\S]*?)(?=##|$)/;
+
 /**
  * Build a compact text digest from active-context, progress, and decisions.
  * Reuses the same files as handleGetContextDigest but returns plain text
@@ -305,9 +251,9 @@ async function buildCompactDigest(
   // Active context
   try {
     const ac = await memoryBankManager.readFile('active-context.md');
-    const taskLines = extractListItems(ac, /## (?:Ongoing )?Tasks/);
-    const issueLines = extractListItems(ac, /## (?:Known )?Issues/);
-    const nextLines = extractListItems(ac, /## Next Steps/);
+    const taskLines = extractListItems(ac, TASKS_SECTION);
+    const issueLines = extractListItems(ac, ISSUES_SECTION);
+    const nextLines = extractListItems(ac, NEXT_STEPS_SECTION);
 
     if (taskLines.length > 0) parts.push('Tasks: ' + taskLines.join('; '));
     if (issueLines.length > 0) parts.push('Issues: ' + issueLines.join('; '));
@@ -341,8 +287,8 @@ async function buildCompactDigest(
   return text;
 }
 
-function extractListItems(content: string, headingPattern: RegExp): string[] {
-  const match = content.match(new RegExp(headingPattern.source + '\\s+([\\s\\S]*?)(?=##|$)'));
+function extractListItems(content: string, sectionPattern: RegExp): string[] {
+  const match = content.match(sectionPattern);
   if (!match) return [];
   return match[1]
     .split('\n')
@@ -610,17 +556,27 @@ export async function handleGetTargetedContext(
       rationale: string;
     }> = [];
 
-    // Select up to maxFiles unique valid pointers
+    // Select up to maxFiles unique valid pointers. Candidates are read
+    // maxFiles at a time so the reads overlap (each may be an SSH round-trip),
+    // and the content is kept for excerpting instead of being read again.
     const validPointers: DocPointer[] = [];
-    for (const ptr of pointers) {
-      if (validPointers.length >= maxFiles) break;
-      try {
-        // Validate path via MemoryBankManager (enforces safety)
-        await memoryBankManager.readFile(ptr.path);
-        validPointers.push(ptr);
-      } catch {
-        // Path invalid or file not found — drop silently
-        logger.debug('KGContextTools', `Dropped invalid pointer: ${ptr.path}`);
+    const pointerContent = new Map<DocPointer, string>();
+    const batchSize = Math.max(1, Math.floor(maxFiles));
+    for (let i = 0; i < pointers.length && validPointers.length < maxFiles; i += batchSize) {
+      const batch = pointers.slice(i, i + batchSize);
+      // Validate path via MemoryBankManager (enforces safety)
+      const reads = await Promise.allSettled(
+        batch.map((ptr) => memoryBankManager.readFile(ptr.path))
+      );
+      for (let j = 0; j < batch.length && validPointers.length < maxFiles; j++) {
+        const read = reads[j];
+        if (read.status === 'fulfilled') {
+          validPointers.push(batch[j]);
+          pointerContent.set(batch[j], read.value);
+        } else {
+          // Path invalid or file not found — drop silently
+          logger.debug('KGContextTools', `Dropped invalid pointer: ${batch[j].path}`);
+        }
       }
     }
 
@@ -632,7 +588,7 @@ export async function handleGetTargetedContext(
       }
 
       try {
-        const fileContent = await memoryBankManager.readFile(ptr.path);
+        const fileContent = pointerContent.get(ptr)!;
         let result: { excerpt: string; truncated: boolean } | null = null;
 
         // Try heading-based first, then query-match, then top-of-file
@@ -662,7 +618,7 @@ export async function handleGetTargetedContext(
         });
         usedChars += result.excerpt.length;
       } catch (err) {
-        logger.debug('KGContextTools', `Error reading ${ptr.path}: ${err}`);
+        logger.debug('KGContextTools', `Error excerpting ${ptr.path}: ${err}`);
       }
     }
 
@@ -1,5 +1,6 @@
 import { MemoryBankManager } from '../../core/MemoryBankManager.js';
 import { LogManager } from '../../utils/LogManager.js';
+import { MODE_NAMES } from '../../types/memory-bank-constants.js';
 
 const logger = LogManager.getInstance();
 
@@ -154,14 +155,12 @@ export async function handleSwitchMode(
   }
 
   // Switch to specified mode
-  const validModes = ['architect', 'ask', 'code', 'debug', 'test'];
-  
-  if (!validModes.includes(mode)) {
+  if (!MODE_NAMES.includes(mode)) {
     return {
       content: [
         {
           type: 'text',
-          text: `Invalid mode: ${mode}. Valid modes are: ${validModes.join(', ')}`,
+          text: `Invalid mode: ${mode}. Valid modes are: ${MODE_NAMES.join(', ')}`,
         },
       ],
       isError: true,
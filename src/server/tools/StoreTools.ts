@@ -78,17 +78,21 @@ export interface StoreInfo {
   lastUsedAt: string;
 }
 
-// ============================================================================
-// Singleton registry instance (shared across tool calls)
-// ============================================================================
-
-let _registry: StoreRegistry | null = null;
-
-function getRegistry(): StoreRegistry {
-  if (!_registry) {
-    _registry = new StoreRegistry();
+/**
+ * Counts a memory bank's files and checks for a knowledge graph. Both checks
+ * run concurrently; a missing or unreadable store reports zero files and no
+ * graph.
+ */
+async function probeStore(mbDir: string): Promise<{ fileCount: number; hasGraph: boolean }> {
+  try {
+    const [files, hasGraph] = await Promise.all([
+      FileUtils.listFiles(mbDir),
+      FileUtils.fileExists(path.join(mbDir, 'graph', 'graph.jsonl')),
+    ]);
+    return { fileCount: files.length, hasGraph };
+  } catch {
+    return { fileCount: 0, hasGraph: false };
   }
-  return _registry;
 }
 
 // ============================================================================
@@ -105,7 +109,7 @@ export async function handleListStores(
 ) {
   const memoryBankDir = memoryBankManager.getMemoryBankDir();
   const projectPath = memoryBankManager.getProjectPath();
-  const registry = getRegistry();
+  const registry = StoreRegistry.getInstance();
   const registryData = await registry.load();
 
   const stores: StoreInfo[] = [];
@@ -114,15 +118,8 @@ export async function handleListStores(
   // 1. Active store (always first)
   if (memoryBankDir) {
     const activePath = projectPath || path.dirname(memoryBankDir);
-    let fileCount = 0;
-    let hasGraph = false;
-    try {
-      const files = await FileUtils.listFiles(memoryBankDir);
-      fileCount = files.length;
-      hasGraph = await FileUtils.fileExists(path.join(memoryBankDir, 'graph', 'graph.jsonl'));
-    } catch {
-      // Ignore — store might not be fully initialized
-    }
+    // Store might not be fully initialized; probeStore reports it as empty
+    const { fileCount, hasGraph } = await probeStore(memoryBankDir);
 
     // Use registry storeId when the active path matches a registered store,
     // otherwise fall back to path.basename(). This keeps list_stores IDs
@@ -143,23 +140,23 @@ export async function handleListStores(
   }
 
   // 2. Registry entries (skip duplicates of active store)
-  for (const entry of registryData.stores) {
+  const entries = registryData.stores.filter(entry => {
     if (seenPaths.has(entry.projectPath)) {
-      continue;
+      return false;
     }
     seenPaths.add(entry.projectPath);
-
-    let hasGraph = false;
-    let fileCount = 0;
-    try {
-      const mbDir = path.join(entry.projectPath, 'memory-bank');
-      const files = await FileUtils.listFiles(mbDir);
-      fileCount = files.length;
-      hasGraph = await FileUtils.fileExists(path.join(mbDir, 'graph', 'graph.jsonl'));
-    } catch {
-      // Store may not exist anymore — still show it
-    }
-
+    return true;
+  });
+
+  // Probe every store at once rather than one after another. A store that
+  // no longer exists is still shown.
+  const probes = await Promise.all(
+    entries.map(entry => probeStore(path.join(entry.projectPath, 'memory-bank')))
+  );
+
+  for (let i = 0; i < entries.length; i++) {
+    const entry = entries[i];
+    const { fileCount, hasGraph } = probes[i];
     stores.push({
       id: entry.storeId,
       path: entry.projectPath,
@@ -203,7 +200,7 @@ export async function handleSelectStore(
   action: 'select' | 'register' | 'unregister' = 'select',
   kind: 'local' | 'remote' = 'local',
 ) {
-  const registry = getRegistry();
+  const registry = StoreRegistry.getInstance();
 
   // Handle unregister action
   if (action === 'unregister') {
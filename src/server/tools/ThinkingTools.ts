@@ -53,19 +53,46 @@ interface SessionState {
 const sessions = new Map<string, SessionState>();
 const DEFAULT_SESSION = '__default__';
 
+/** Maximum thoughts retained per session (and per branch); oldest are dropped */
+const MAX_SESSION_HISTORY = 1000;
+/** Maximum concurrent sessions; the least recently used one is evicted */
+const MAX_SESSIONS = 100;
+
 function getSession(sessionId?: string): SessionState {
   const key = sessionId || DEFAULT_SESSION;
   let session = sessions.get(key);
-  if (!session) {
+  if (session) {
+    // Re-insert so Map iteration order tracks recency of use
+    sessions.delete(key);
+  } else {
     session = { history: [], branches: {} };
-    sessions.set(key, session);
+    if (sessions.size >= MAX_SESSIONS) {
+      const oldest = sessions.keys().next().value;
+      if (oldest !== undefined) {
+        sessions.delete(oldest);
+      }
+    }
   }
+  sessions.set(key, session);
   return session;
 }
 
-function resetSession(sessionId?: string): void {
+/**
+ * Appends a thought to a bounded list, dropping the oldest entries on overflow.
+ */
+function pushBounded(list: ThoughtData[], data: ThoughtData): void {
+  list.push(data);
+  if (list.length > MAX_SESSION_HISTORY) {
+    list.splice(0, list.length - MAX_SESSION_HISTORY);
+  }
+}
+
+/**
+ * Drops a session, returning whether it existed.
+ */
+function resetSession(sessionId?: string): boolean {
   const key = sessionId || DEFAULT_SESSION;
-  sessions.delete(key);
+  return sessions.delete(key);
 }
 
 function resetAllSessions(): void {
@@ -267,8 +294,7 @@ export function handleSequentialThinking(input: {
     // Handle reset mode
     if (input.reset) {
       if (input.sessionId) {
-        const had = sessions.has(input.sessionId);
-        resetSession(input.sessionId);
+        const had = resetSession(input.sessionId);
         return {
           content: [
             {
@@ -337,14 +363,14 @@ export function handleSequentialThinking(input: {
     }
 
     const session = getSession(data.sessionId);
-    session.history.push(data);
+    pushBounded(session.history, data);
 
     // Track branch
     if (data.branchFromThought && data.branchId) {
       if (!session.branches[data.branchId]) {
         session.branches[data.branchId] = [];
       }
-      session.branches[data.branchId].push(data);
+      pushBounded(session.branches[data.branchId], data);
     }
 
     // Log metadata to stderr (NEVER the raw thought text)
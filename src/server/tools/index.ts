@@ -34,6 +34,99 @@ export const allTools = [
   ...kgContextTools,
 ];
 
+/**
+ * Tools that may be called without an arguments object
+ */
+const TOOLS_WITHOUT_REQUIRED_ARGS: ReadonlySet<string> = new Set([
+  'get_instructions',
+  'get_memory_bank_status',
+  'list_memory_bank_files',
+  'get_context_bundle',
+  'get_context_digest',
+  'migrate_file_naming',
+  'create_backup',
+  'update_tasks',
+  'list_stores',
+]);
+
+/**
+ * Builds the response for tools that need an active Memory Bank.
+ * A fresh object per call, so nothing downstream can alter a shared one.
+ */
+function memoryBankNotFound() {
+  return {
+    content: [
+      {
+        type: 'text',
+        text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
+      },
+    ],
+    isError: true,
+  };
+}
+
+/**
+ * Migration guidance for tools that were removed or folded into other tools.
+ * Built once at module load; consulted only for unknown tool names.
+ */
+const DEPRECATED_TOOL_REDIRECTS: ReadonlyMap<string, { tool: string; params: string; example: string }> = new Map([
+  ['get_current_mode', {
+    tool: 'switch_mode',
+    params: 'none (call with no parameters)',
+    example: '{ }',
+  }],
+  ['process_umb_command', {
+    tool: 'switch_mode',
+    params: 'umb: true',
+    example: '{ "umb": true }',
+  }],
+  ['complete_umb', {
+    tool: 'switch_mode',
+    params: 'umb: false',
+    example: '{ "umb": false }',
+  }],
+  ['list_backups', {
+    tool: 'create_backup',
+    params: 'listOnly: true',
+    example: '{ "listOnly": true }',
+  }],
+  ['register_store', {
+    tool: 'list_stores',
+    params: 'action: "register", path: "...", storeId: "..."',
+    example: '{ "action": "register", "path": "/path/to/project", "storeId": "my-project" }',
+  }],
+  ['unregister_store', {
+    tool: 'list_stores',
+    params: 'action: "unregister", storeId: "..."',
+    example: '{ "action": "unregister", "storeId": "my-project" }',
+  }],
+  ['reset_sequential_thinking', {
+    tool: 'sequential_thinking',
+    params: 'reset: true',
+    example: '{ "reset": true }',
+  }],
+  ['graph_unlink_entities', {
+    tool: 'graph_link_entities',
+    params: 'action: "unlink", from: "...", to: "...", relationType: "..."',
+    example: '{ "action": "unlink", "from": "EntityA", "to": "EntityB", "relationType": "relates_to" }',
+  }],
+  ['graph_delete_observation', {
+    tool: 'graph_delete_entity',
+    params: 'entity: "...", observationId: "..."',
+    example: '{ "entity": "EntityName", "observationId": "obs_xxx" }',
+  }],
+  ['graph_rebuild', {
+    tool: 'graph_maintain',
+    params: 'operation: "rebuild"',
+    example: '{ "operation": "rebuild" }',
+  }],
+  ['graph_compact', {
+    tool: 'graph_maintain',
+    params: 'operation: "compact"',
+    example: '{ "operation": "compact" }',
+  }],
+]);
+
 /**
  * Sets up all tool handlers for the MCP server
  * @param server MCP Server
@@ -50,29 +143,34 @@ export function setupToolHandlers(
     tools: allTools,
   }));
 
+  // Auto-discovery probes the file system (several SSH round-trips when
+  // remote). Tool calls that arrive while a probe is in flight wait for it
+  // instead of starting their own; once it settles without finding a
+  // directory, the next call probes again.
+  let autoDiscovery: Promise<void> | null = null;
+
   // Register handler for tool calls
   server.setRequestHandler(CallToolRequestSchema, async (request) => {
     try {
       // Find Memory Bank directory if not found yet
       if (!memoryBankManager.getMemoryBankDir()) {
-        const CWD = process.cwd();
-        const memoryBankDir = await memoryBankManager.findMemoryBankDir(CWD);
-        if (memoryBankDir) {
-          memoryBankManager.setMemoryBankDir(memoryBankDir);
+        if (!autoDiscovery) {
+          autoDiscovery = (async () => {
+            const CWD = process.cwd();
+            const memoryBankDir = await memoryBankManager.findMemoryBankDir(CWD);
+            if (memoryBankDir && !memoryBankManager.getMemoryBankDir()) {
+              memoryBankManager.setMemoryBankDir(memoryBankDir);
+            }
+          })().finally(() => {
+            autoDiscovery = null;
+          });
         }
+        await autoDiscovery;
       }
 
       // Check if arguments are valid
       if (
-        request.params.name !== 'get_instructions' &&
-        request.params.name !== 'get_memory_bank_status' &&
-        request.params.name !== 'list_memory_bank_files' &&
-        request.params.name !== 'get_context_bundle' &&
-        request.params.name !== 'get_context_digest' &&
-        request.params.name !== 'migrate_file_naming' &&
-        request.params.name !== 'create_backup' &&
-        request.params.name !== 'update_tasks' &&
-        request.params.name !== 'list_stores' &&
+        !TOOLS_WITHOUT_REQUIRED_ARGS.has(request.params.name) &&
         (!request.params.arguments || typeof request.params.arguments !== 'object')
       ) {
         throw new McpError(ErrorCode.InvalidParams, 'Invalid arguments');
@@ -107,15 +205,7 @@ export function setupToolHandlers(
 
         case 'read_memory_bank_file': {
           if (!memoryBankManager.getMemoryBankDir()) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
 
           const { filename } = request.params.arguments as { filename: string };
@@ -127,15 +217,7 @@ export function setupToolHandlers(
 
         case 'write_memory_bank_file': {
           if (!memoryBankManager.getMemoryBankDir()) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
 
           const { filename, content, ifMatchEtag } = request.params.arguments as {
@@ -154,30 +236,14 @@ export function setupToolHandlers(
 
         case 'list_memory_bank_files': {
           if (!memoryBankManager.getMemoryBankDir()) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
           return handleListMemoryBankFiles(memoryBankManager);
         }
 
         case 'get_memory_bank_status': {
           if (!memoryBankManager.getMemoryBankDir()) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
           return handleGetMemoryBankStatus(memoryBankManager);
         }
@@ -190,15 +256,7 @@ export function setupToolHandlers(
         case 'track_progress': {
           const progressTracker = getProgressTracker();
           if (!progressTracker) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
 
           const { action, description } = request.params.arguments as {
@@ -218,15 +276,7 @@ export function setupToolHandlers(
         case 'update_active_context': {
           const progressTracker = getProgressTracker();
           if (!progressTracker) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
 
           const { tasks, issues, nextSteps } = request.params.arguments as {
@@ -241,15 +291,7 @@ export function setupToolHandlers(
         case 'log_decision': {
           const progressTracker = getProgressTracker();
           if (!progressTracker) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: 'Memory Bank not found. Use initialize_memory_bank to create one.',
-                },
-              ],
-              isError: true,
-            };
+            return memoryBankNotFound();
           }
 
           const { title, context, decision, alternatives, consequences } = request.params.arguments as {
@@ -325,8 +367,8 @@ export function setupToolHandlers(
 
         // Backup and restore tools (P1 improvements)
         case 'create_backup': {
-          const args = request.params.arguments as { backupDir?: string; listOnly?: boolean } | undefined;
-          return handleCreateBackup(memoryBankManager, args?.backupDir, args?.listOnly);
+          const args = request.params.arguments as { backupDir?: string; listOnly?: boolean; limit?: number } | undefined;
+          return handleCreateBackup(memoryBankManager, args?.backupDir, args?.listOnly, args?.limit);
         }
 
         case 'restore_backup': {
@@ -607,65 +649,7 @@ export function setupToolHandlers(
         // Unknown or deprecated tool
         default: {
           // Check if it's a deprecated tool and provide migration guidance
-          const deprecatedToolRedirects: Record<string, { tool: string; params: string; example: string }> = {
-            'get_current_mode': {
-              tool: 'switch_mode',
-              params: 'none (call with no parameters)',
-              example: '{ }',
-            },
-            'process_umb_command': {
-              tool: 'switch_mode',
-              params: 'umb: true',
-              example: '{ "umb": true }',
-            },
-            'complete_umb': {
-              tool: 'switch_mode',
-              params: 'umb: false',
-              example: '{ "umb": false }',
-            },
-            'list_backups': {
-              tool: 'create_backup',
-              params: 'listOnly: true',
-              example: '{ "listOnly": true }',
-            },
-            'register_store': {
-              tool: 'list_stores',
-              params: 'action: "register", path: "...", storeId: "..."',
-              example: '{ "action": "register", "path": "/path/to/project", "storeId": "my-project" }',
-            },
-            'unregister_store': {
-              tool: 'list_stores',
-              params: 'action: "unregister", storeId: "..."',
-              example: '{ "action": "unregister", "storeId": "my-project" }',
-            },
-            'reset_sequential_thinking': {
-              tool: 'sequential_thinking',
-              params: 'reset: true',
-              example: '{ "reset": true }',
-            },
-            'graph_unlink_entities': {
-              tool: 'graph_link_entities',
-              params: 'action: "unlink", from: "...", to: "...", relationType: "..."',
-              example: '{ "action": "unlink", "from": "EntityA", "to": "EntityB", "relationType": "relates_to" }',
-            },
-            'graph_delete_observation': {
-              tool: 'graph_delete_entity',
-              params: 'entity: "...", observationId: "..."',
-              example: '{ "entity": "EntityName", "observationId": "obs_xxx" }',
-            },
-            'graph_rebuild': {
-              tool: 'graph_maintain',
-              params: 'operation: "rebuild"',
-              example: '{ "operation": "rebuild" }',
-            },
-            'graph_compact': {
-              tool: 'graph_maintain',
-              params: 'operation: "compact"',
-              example: '{ "operation": "compact" }',
-            },
-          };
-
-          const redirect = deprecatedToolRedirects[request.params.name];
+          const redirect = DEPRECATED_TOOL_REDIRECTS.get(request.params.name);
           if (redirect) {
             return {
               content: [
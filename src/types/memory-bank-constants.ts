@@ -46,6 +46,9 @@ export const DEFAULT_MODES = {
   }
 };
 
+/** Names of the supported modes, in declaration order */
+export const MODE_NAMES: readonly string[] = Object.keys(DEFAULT_MODES);
+
 /** Interface for Memory Bank files */
 export interface MemoryBankFiles {
   productContext: string;
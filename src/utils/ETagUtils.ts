@@ -18,9 +18,31 @@ export class ETagUtils {
    * @returns ETag string (16-character hex string)
    */
   static calculateETag(content: string): string {
-    const hash = crypto.createHash('sha256');
-    hash.update(content);
-    return hash.digest('hex').substring(0, 16);
+    // Hex-encode only the 8 digest bytes that make up the ETag
+    return crypto.createHash('sha256').update(content).digest().toString('hex', 0, 8);
+  }
+
+  /**
+   * Starts an ETag computation for content that grows by appends
+   * 
+   * Feed appended content to the returned hash with update() and read the
+   * ETag of everything fed so far with etagOf(), without re-hashing it.
+   * 
+   * @param content - Initial content
+   * @returns Running hash of the content
+   */
+  static createRunningHash(content: string): crypto.Hash {
+    return crypto.createHash('sha256').update(content);
+  }
+
+  /**
+   * Gets the ETag of everything fed to a running hash, which stays usable
+   * 
+   * @param hash - Running hash from createRunningHash
+   * @returns ETag string, identical to calculateETag of the same content
+   */
+  static etagOf(hash: crypto.Hash): string {
+    return hash.copy().digest().toString('hex', 0, 8);
   }
 
   /**
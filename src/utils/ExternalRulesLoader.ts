@@ -2,12 +2,19 @@ import fs from 'fs-extra';
 import path from 'path';
 import { EventEmitter } from 'events';
 import yaml from 'js-yaml';
-import { mcpRulesTemplates } from './McpRulesTemplates.js';
 import os from 'os';
 import { ValidationResult } from '../types/index.js';
+import { MODE_NAMES } from '../types/memory-bank-constants.js';
 import { McpRuleBase, MemoryBankConfig } from '../types/rules.js';
 import { logger } from './LogManager.js';
 
+/** Quiet period after the last change event before a rule file is re-read */
+const RELOAD_DEBOUNCE_MS = 100;
+/** Upper bound for the backoff between reload retries */
+const RELOAD_MAX_DELAY_MS = 2000;
+/** Reload attempts before giving up on a file that keeps failing to parse */
+const RELOAD_MAX_ATTEMPTS = 5;
+
 /**
  * Class responsible for loading and monitoring external .mcprules files
  * (previously called .clinerules files, renamed for MCP-server independence)
@@ -16,6 +23,10 @@ export class ExternalRulesLoader extends EventEmitter {
   private projectDir: string;
   private rules: Map<string, McpRuleBase> = new Map();
   private watchers: fs.FSWatcher[] = [];
+  private reloadTimers: Map<string, NodeJS.Timeout> = new Map();
+  // Bumped by stopWatching(), so a reload already past its timer (awaiting
+  // the file read) neither applies its result nor re-arms a retry
+  private watchGeneration = 0;
   
   /**
    * Creates a new instance of the external rules loader
@@ -52,7 +63,6 @@ export class ExternalRulesLoader extends EventEmitter {
    * @returns Validation result with missing and existing files
    */
   async validateRequiredFiles(): Promise<ValidationResult> {
-    const modes = ['architect', 'ask', 'code', 'debug', 'test'];
     const missingFiles: string[] = [];
     const existingFiles: string[] = [];
     
@@ -67,7 +77,7 @@ export class ExternalRulesLoader extends EventEmitter {
     
     // Check for files in both project directory and fallback directory
     // Also check for legacy .clinerules files
-    for (const mode of modes) {
+    for (const mode of MODE_NAMES) {
       const mcpRulesFilename = `.mcprules-${mode}`;
       const legacyFilename = `.clinerules-${mode}`;
       const projectMcpRulesPath = path.join(this.projectDir, mcpRulesFilename);
@@ -101,8 +111,6 @@ export class ExternalRulesLoader extends EventEmitter {
    * Also supports legacy .clinerules files for backward compatibility
    */
   async detectAndLoadRules(): Promise<Map<string, McpRuleBase>> {
-    const modes = ['architect', 'ask', 'code', 'debug', 'test'];
-    
     // Validate required files and create missing ones
     const validation = await this.validateRequiredFiles();
     if (!validation.valid) {
@@ -118,7 +126,7 @@ export class ExternalRulesLoader extends EventEmitter {
     // Get the fallback directory
     const fallbackDir = await this.getWritableDirectory();
     
-    for (const mode of modes) {
+    for (const mode of MODE_NAMES) {
       const mcpRulesFilename = `.mcprules-${mode}`;
       const legacyFilename = `.clinerules-${mode}`;
       const projectMcpRulesPath = path.join(this.projectDir, mcpRulesFilename);
@@ -231,38 +239,86 @@ export class ExternalRulesLoader extends EventEmitter {
   
   /**
    * Sets up a watcher for a rule file
+   *
+   * Editors typically emit a burst of change events per save (truncate, write,
+   * rename), so reloads are coalesced and run once the file settles. A reload
+   * that hits a half-written file is retried with exponential backoff.
    * @param filePath File path
    * @param mode Mode associated with the file
    */
   private watchRuleFile(filePath: string, mode: string): void {
-    const watcher = fs.watch(filePath, async (eventType) => {
+    const watcher = fs.watch(filePath, (eventType) => {
       if (eventType === 'change') {
-        try {
-          const content = await fs.readFile(filePath, 'utf8');
-          const rule = this.parseRuleContent(content);
-          
-          if (rule && rule.mode === mode) {
-            this.rules.set(mode, rule);
-            this.emit('ruleChanged', mode, rule);
-            logger.debug('ExternalRulesLoader', `Updated ${path.basename(filePath)} rules`);
-          }
-        } catch (error) {
-          logger.error('ExternalRulesLoader', `Error updating ${path.basename(filePath)}: ${error}`);
-        }
+        this.scheduleReload(filePath, mode, RELOAD_DEBOUNCE_MS, 0);
       }
     });
     
     this.watchers.push(watcher);
   }
+
+  /**
+   * Schedules a reload of a rule file, replacing any reload already pending for it
+   * @param filePath File path
+   * @param mode Mode associated with the file
+   * @param delay Delay in milliseconds before reading the file
+   * @param attempt Number of failed attempts so far
+   */
+  private scheduleReload(filePath: string, mode: string, delay: number, attempt: number): void {
+    const pending = this.reloadTimers.get(filePath);
+    if (pending) {
+      clearTimeout(pending);
+    }
+
+    const generation = this.watchGeneration;
+    const timer = setTimeout(async () => {
+      this.reloadTimers.delete(filePath);
+      try {
+        const content = await fs.readFile(filePath, 'utf8');
+        if (generation !== this.watchGeneration) {
+          return;
+        }
+        const rule = this.parseRuleContent(content);
+        
+        if (rule && rule.mode === mode) {
+          this.rules.set(mode, rule);
+          this.emit('ruleChanged', mode, rule);
+          logger.debug('ExternalRulesLoader', `Updated ${path.basename(filePath)} rules`);
+          return;
+        }
+        if (attempt + 1 < RELOAD_MAX_ATTEMPTS) {
+          this.scheduleReload(filePath, mode, Math.min(delay * 2, RELOAD_MAX_DELAY_MS), attempt + 1);
+        } else {
+          logger.warn('ExternalRulesLoader', `Ignoring change to ${path.basename(filePath)}: not a valid rule file for mode ${mode}`);
+        }
+      } catch (error) {
+        if (generation !== this.watchGeneration) {
+          return;
+        }
+        if (attempt + 1 < RELOAD_MAX_ATTEMPTS) {
+          this.scheduleReload(filePath, mode, Math.min(delay * 2, RELOAD_MAX_DELAY_MS), attempt + 1);
+        } else {
+          logger.error('ExternalRulesLoader', `Error updating ${path.basename(filePath)}: ${error}`);
+        }
+      }
+    }, delay);
+    timer.unref?.();
+
+    this.reloadTimers.set(filePath, timer);
+  }
   
   /**
    * Stops watching all rule files
    */
   stopWatching(): void {
+    this.watchGeneration++;
     for (const watcher of this.watchers) {
       watcher.close();
     }
     this.watchers = [];
+    for (const timer of this.reloadTimers.values()) {
+      clearTimeout(timer);
+    }
+    this.reloadTimers.clear();
   }
   
   /**
@@ -308,6 +364,10 @@ export class ExternalRulesLoader extends EventEmitter {
   async createMissingMcpRules(missingFiles: string[]): Promise<string[]> {
     const createdFiles: string[] = [];
     
+    // The templates (~30 KB of YAML) are only needed when rule files are
+    // missing, so they are loaded on first use rather than at startup
+    const { mcpRulesTemplates } = await import('./McpRulesTemplates.js');
+    
     // Get a writable directory for .mcprules files
     const targetDir = await this.getWritableDirectory();
     
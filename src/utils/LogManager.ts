@@ -35,6 +35,26 @@ const DEFAULT_CONFIG: LogManagerConfig = {
   minLevel: LogLevel.INFO
 };
 
+/**
+ * Numeric priority of each level, used for minimum-level filtering
+ */
+const LEVEL_PRIORITY: Readonly<Record<LogLevel, number>> = {
+  [LogLevel.DEBUG]: 0,
+  [LogLevel.INFO]: 1,
+  [LogLevel.WARN]: 2,
+  [LogLevel.ERROR]: 3
+};
+
+/**
+ * Pre-rendered level tags, e.g. "[DEBUG]"
+ */
+const LEVEL_TAGS: Readonly<Record<LogLevel, string>> = {
+  [LogLevel.DEBUG]: '[DEBUG]',
+  [LogLevel.INFO]: '[INFO]',
+  [LogLevel.WARN]: '[WARN]',
+  [LogLevel.ERROR]: '[ERROR]'
+};
+
 /**
  * Log Manager class
  */
@@ -80,17 +100,20 @@ export class LogManager {
     this.config.debugMode = false;
   }
 
+  /**
+   * Check whether messages at the given level are currently emitted.
+   *
+   * Callers on hot paths can use this to skip building expensive messages
+   * that would be discarded anyway.
+   */
+  public isLevelEnabled(level: LogLevel): boolean {
+    return this.shouldLog(level);
+  }
+
   /**
    * Check if a message should be logged based on current configuration
    */
   private shouldLog(level: LogLevel): boolean {
-    const levelPriority = {
-      [LogLevel.DEBUG]: 0,
-      [LogLevel.INFO]: 1,
-      [LogLevel.WARN]: 2,
-      [LogLevel.ERROR]: 3
-    };
-
     // Always log errors regardless of debug mode
     if (level === LogLevel.ERROR) {
       return true;
@@ -102,7 +125,7 @@ export class LogManager {
     }
 
     // Check minimum level
-    return levelPriority[level] >= levelPriority[this.config.minLevel];
+    return LEVEL_PRIORITY[level] >= LEVEL_PRIORITY[this.config.minLevel];
   }
 
   /**
@@ -117,7 +140,7 @@ export class LogManager {
     }
 
     // Add level
-    parts.push(`[${level.toUpperCase()}]`);
+    parts.push(LEVEL_TAGS[level]);
 
     // Add source if configured
     if (this.config.showSource && source) {
@@ -202,5 +225,6 @@ export const logger = {
   info: (source: string, message: string) => getLogManager().info(source, message),
   warn: (source: string, message: string) => getLogManager().warn(source, message),
   error: (source: string, message: string) => getLogManager().error(source, message),
-  log: (level: LogLevel, source: string, message: string) => getLogManager().log(level, source, message)
+  log: (level: LogLevel, source: string, message: string) => getLogManager().log(level, source, message),
+  isDebugEnabled: () => getLogManager().isLevelEnabled(LogLevel.DEBUG)
 }; 
\ No newline at end of file
@@ -30,6 +30,8 @@ export class ModeManager extends EventEmitter {
   private currentMode: string = 'code'; // Default mode
   private isUmbActive: boolean = false;
   private memoryBankStatus: 'ACTIVE' | 'INACTIVE' = 'INACTIVE';
+  // Compiled UMB trigger, keyed by its source pattern (null regex = invalid)
+  private umbTrigger: { pattern: string; regex: RegExp | null } | null = null;
   
   /**
    * Creates a new instance of the mode manager
@@ -115,14 +117,24 @@ export class ModeManager extends EventEmitter {
       return false;
     }
     
-    try {
-      const triggerRegex = new RegExp(currentRules.instructions.umb.trigger, 'i');
-      return triggerRegex.test(text);
-    } catch {
-      // Fallback for invalid regex patterns (e.g. PCRE-only syntax like (?i))
-      const lower = text.toLowerCase();
-      return lower.includes('update memory bank') || lower.includes('umb');
+    const pattern = currentRules.instructions.umb.trigger;
+    if (!this.umbTrigger || this.umbTrigger.pattern !== pattern) {
+      let regex: RegExp | null;
+      try {
+        regex = new RegExp(pattern, 'i');
+      } catch {
+        regex = null;
+      }
+      this.umbTrigger = { pattern, regex };
+    }
+
+    if (this.umbTrigger.regex) {
+      return this.umbTrigger.regex.test(text);
     }
+
+    // Fallback for invalid regex patterns (e.g. PCRE-only syntax like (?i))
+    const lower = text.toLowerCase();
+    return lower.includes('update memory bank') || lower.includes('umb');
   }
   
   /**
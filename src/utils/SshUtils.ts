@@ -1,8 +1,80 @@
 import * as fs from 'fs';
-import { execFile as execFileCallback, ExecException } from 'child_process';
+import * as os from 'os';
+import * as path from 'path';
+import { createHash } from 'crypto';
+import { execFile as execFileCallback, ExecException, spawn } from 'child_process';
 import * as util from 'util';
 import { logger } from './LogManager.js';
 
+/**
+ * Default time (seconds) an idle multiplexed SSH master connection is kept open.
+ * Every file operation is a separate `ssh` invocation; with a shared master
+ * only the first one pays for TCP + key exchange + authentication.
+ */
+const DEFAULT_CONTROL_PERSIST_SECONDS = 60;
+
+/**
+ * Idle lifetime of the master connection, overridable through
+ * MEMORY_BANK_SSH_CONTROL_PERSIST for sessions with long gaps between calls
+ */
+const CONTROL_PERSIST_SECONDS = parsePositiveInt(
+  process.env.MEMORY_BANK_SSH_CONTROL_PERSIST,
+  DEFAULT_CONTROL_PERSIST_SECONDS
+);
+
+/**
+ * Default number of commands allowed in flight over one master connection.
+ * sshd refuses sessions beyond its MaxSessions (10 by default), and a refused
+ * command falls back to a full new connection, so stay just below it.
+ */
+const DEFAULT_MAX_SESSIONS = 8;
+
+/**
+ * Maximum concurrent commands per master connection, overridable through
+ * MEMORY_BANK_SSH_MAX_SESSIONS for servers with a different MaxSessions
+ */
+const MAX_SESSIONS_PER_CONNECTION = parsePositiveInt(
+  process.env.MEMORY_BANK_SSH_MAX_SESSIONS,
+  DEFAULT_MAX_SESSIONS
+);
+
+/**
+ * State of a multiplexed master connection, shared by every SshUtils instance
+ * that targets the same user/host/key. RemoteFileSystem instances are created
+ * freely, so tracking this per instance would re-probe the socket each time.
+ */
+interface MasterConnectionState {
+  remoteUser: string;
+  remoteHost: string;
+  lastUse: number;
+  // Whether the last startup attempt left a master running; while false,
+  // commands connect directly without any ControlPath options
+  multiplexed: boolean;
+  startup: Promise<boolean> | null;
+  activeSessions: number;
+  waiters: Array<() => void>;
+}
+
+/**
+ * Session usage of one master connection, as reported by getConnectionStats
+ */
+export interface SshConnectionStats {
+  target: string;
+  activeSessions: number;
+  waitingCommands: number;
+  maxSessions: number;
+}
+
+const masterConnections = new Map<string, MasterConnectionState>();
+
+// ControlPath per user@host:key target, so the startup probe and every
+// later RemoteFileSystem for the same target derive it only once
+const controlPaths = new Map<string, string>();
+
+// Private directory holding this process's control sockets; null once
+// creating or verifying it failed (multiplexing is then disabled)
+let controlDir: string | null | undefined;
+
 // Type for the exec callback function
 type ExecCallback = (error: ExecException | null, stdout: string, stderr: string) => void;
 
@@ -15,6 +87,14 @@ function shellEscapeSingleQuote(value: string): string {
   return "'" + value.replace(/'/g, "'\\''") + "'";
 }
 
+/**
+ * Parses a positive integer setting, falling back to a default when unset or invalid
+ */
+function parsePositiveInt(value: string | undefined, fallback: number): number {
+  const parsed = Number.parseInt(value ?? '', 10);
+  return Number.isInteger(parsed) && parsed > 0 ? parsed : fallback;
+}
+
 /**
  * Utility class for SSH operations
  * 
@@ -27,6 +107,11 @@ export class SshUtils {
   private remotePath: string;
   private debugMode: boolean;
   private strictHostKeyChecking: boolean;
+  private controlPath: string | null;
+  // Connection options shared by every command, ending with the target:
+  // one set riding on the master connection, one for direct connections
+  private readonly multiplexedArgs: readonly string[];
+  private readonly directArgs: readonly string[];
 
   /**
    * Creates a new SshUtils instance
@@ -55,6 +140,97 @@ export class SshUtils {
     this.debugMode = options?.debugMode ?? false;
     // Default to strict host key checking for security, but allow opt-out
     this.strictHostKeyChecking = options?.strictHostKeyChecking ?? true;
+    // OpenSSH connection multiplexing needs Unix domain sockets, which the
+    // Windows OpenSSH client does not support
+    this.controlPath = process.platform === 'win32'
+      ? null
+      : SshUtils.getControlPath(remoteUser, remoteHost, sshKeyPath);
+    this.multiplexedArgs = this.buildBaseArgs(this.controlPath);
+    this.directArgs = this.buildBaseArgs(null);
+  }
+
+  /**
+   * Builds the SSH arguments that are identical for every command
+   *
+   * @param controlPath - Master connection socket to use, or null for a direct connection
+   */
+  private buildBaseArgs(controlPath: string | null): string[] {
+    const args: string[] = [];
+
+    if (this.debugMode) {
+      args.push('-v');
+    }
+
+    args.push('-i', this.sshKeyPath);
+
+    const hostKeyOption = this.strictHostKeyChecking
+      ? 'accept-new'
+      : 'no';
+    args.push('-o', `StrictHostKeyChecking=${hostKeyOption}`);
+    args.push('-o', 'ConnectTimeout=10');
+    args.push('-o', 'ServerAliveInterval=30');
+    args.push('-o', 'ServerAliveCountMax=3');
+    if (controlPath) {
+      // Ride on the master connection started by ensureMasterConnection
+      args.push('-o', 'ControlMaster=no');
+      args.push('-o', `ControlPath=${controlPath}`);
+    }
+    // Use '--' to stop option parsing and prevent option injection via
+    // remoteUser/remoteHost values (defense in depth alongside constructor validation)
+    args.push('--');
+    args.push(`${this.remoteUser}@${this.remoteHost}`);
+    return args;
+  }
+
+  /**
+   * Builds the ControlPath socket location for a user/host/key combination.
+   * Hashed so it stays well under the Unix socket path length limit.
+   *
+   * @returns The socket path, or null if no private socket directory is available
+   */
+  private static getControlPath(remoteUser: string, remoteHost: string, sshKeyPath: string): string | null {
+    const target = `${remoteUser}@${remoteHost}:${sshKeyPath}`;
+    let controlPath = controlPaths.get(target);
+    if (!controlPath) {
+      const dir = SshUtils.getControlDir();
+      if (!dir) {
+        return null;
+      }
+      const digest = createHash('sha256')
+        .update(target)
+        .digest()
+        .toString('hex', 0, 8);
+      controlPath = path.join(dir, digest);
+      controlPaths.set(target, controlPath);
+    }
+    return controlPath;
+  }
+
+  /**
+   * Creates (once per process) the directory that holds the control sockets.
+   *
+   * The shared temp directory is world-writable, so sockets must not live
+   * there under predictable names: another local user could create one first
+   * and see every command and file content sent over it. mkdtemp gives an
+   * unpredictable directory with mode 0700; its owner and mode are verified
+   * before any socket is placed in it.
+   */
+  private static getControlDir(): string | null {
+    if (controlDir === undefined) {
+      controlDir = null;
+      try {
+        const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'mbmcp-'));
+        const stats = fs.lstatSync(dir);
+        if (stats.isDirectory() && stats.uid === process.getuid?.() && (stats.mode & 0o077) === 0) {
+          controlDir = dir;
+        } else {
+          logger.warn('SshUtils', `Not using SSH connection sharing: ${dir} is not private to this user`);
+        }
+      } catch (error) {
+        logger.warn('SshUtils', `Not using SSH connection sharing: ${error instanceof Error ? error.message : String(error)}`);
+      }
+    }
+    return controlDir;
   }
 
   /**
@@ -74,6 +250,184 @@ export class SshUtils {
     }
   }
 
+  /**
+   * Makes sure a multiplexed master connection is running.
+   *
+   * The master is started detached with stdio ignored: a ControlPersist master
+   * spawned implicitly by a command would inherit that command's output pipes
+   * and keep execFile from ever seeing them close. Failures are not fatal —
+   * commands then simply open their own connections.
+   *
+   * @returns The connection state, or null if commands must connect directly
+   */
+  private async ensureMasterConnection(): Promise<MasterConnectionState | null> {
+    if (!this.controlPath) {
+      return null;
+    }
+
+    let state = masterConnections.get(this.controlPath);
+    if (!state) {
+      state = {
+        remoteUser: this.remoteUser,
+        remoteHost: this.remoteHost,
+        lastUse: 0,
+        multiplexed: false,
+        startup: null,
+        activeSessions: 0,
+        waiters: [],
+      };
+      masterConnections.set(this.controlPath, state);
+    }
+
+    // The master exits on its own after CONTROL_PERSIST_SECONDS of idleness;
+    // only re-check once it may have done so. A failed start is retried
+    // after the same interval.
+    const now = Date.now();
+    if (now - state.lastUse < CONTROL_PERSIST_SECONDS * 1000 * 0.9) {
+      if (!state.multiplexed) {
+        return null;
+      }
+      state.lastUse = now;
+      return state;
+    }
+
+    if (!state.startup) {
+      const current = state;
+      current.startup = this.startMasterConnection()
+        .then((started) => {
+          current.multiplexed = started;
+          current.lastUse = Date.now();
+          return started;
+        })
+        .finally(() => {
+          current.startup = null;
+        });
+    }
+    return (await state.startup) ? state : null;
+  }
+
+  /**
+   * Waits for a free session slot on a master connection
+   */
+  private static async acquireSession(state: MasterConnectionState): Promise<void> {
+    if (state.activeSessions < MAX_SESSIONS_PER_CONNECTION) {
+      state.activeSessions++;
+      return;
+    }
+    // The releasing command hands its slot over directly
+    await new Promise<void>((resolve) => state.waiters.push(resolve));
+  }
+
+  /**
+   * Frees a session slot, passing it to the next waiting command if any
+   */
+  private static releaseSession(state: MasterConnectionState): void {
+    const next = state.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      state.activeSessions--;
+    }
+  }
+
+  /**
+   * Reports session usage for every open master connection, so operators can
+   * see whether MEMORY_BANK_SSH_MAX_SESSIONS is limiting throughput
+   *
+   * @returns One entry per master connection
+   */
+  static getConnectionStats(): SshConnectionStats[] {
+    return Array.from(masterConnections.values())
+      .filter((state) => state.multiplexed)
+      .map((state) => ({
+        target: `${state.remoteUser}@${state.remoteHost}`,
+        activeSessions: state.activeSessions,
+        waitingCommands: state.waiters.length,
+        maxSessions: MAX_SESSIONS_PER_CONNECTION,
+      }));
+  }
+
+  /**
+   * Starts the master connection unless a live one already owns the socket
+   *
+   * @returns Whether a master connection is available on the socket
+   */
+  private async startMasterConnection(): Promise<boolean> {
+    const controlPath = this.controlPath!;
+    const target = `${this.remoteUser}@${this.remoteHost}`;
+    const runSsh = (args: string[]): Promise<boolean> => new Promise((resolve) => {
+      const child = spawn('ssh', args, { stdio: 'ignore' });
+      const timer = setTimeout(() => {
+        child.kill();
+        resolve(false);
+      }, 15000);
+      child.on('error', () => {
+        clearTimeout(timer);
+        resolve(false);
+      });
+      child.on('exit', (code) => {
+        clearTimeout(timer);
+        resolve(code === 0);
+      });
+    });
+
+    // Local socket check only — no network round-trip
+    if (await runSsh(['-o', `ControlPath=${controlPath}`, '-O', 'check', '--', target])) {
+      return true;
+    }
+
+    const hostKeyOption = this.strictHostKeyChecking ? 'accept-new' : 'no';
+    const started = await runSsh([
+      '-i', this.sshKeyPath,
+      '-o', `StrictHostKeyChecking=${hostKeyOption}`,
+      '-o', 'ConnectTimeout=10',
+      '-o', 'ServerAliveInterval=30',
+      '-o', 'ServerAliveCountMax=3',
+      '-o', 'ControlMaster=yes',
+      '-o', `ControlPath=${controlPath}`,
+      '-o', `ControlPersist=${CONTROL_PERSIST_SECONDS}`,
+      '-f', '-N',
+      '--', target,
+    ]);
+    if (!started) {
+      logger.debug('SshUtils', 'Could not start SSH master connection; using direct connections');
+    }
+    return started;
+  }
+
+  /**
+   * Closes every master connection opened by this process.
+   * Called on server shutdown so no background ssh processes outlive it.
+   */
+  static async closeAllConnections(): Promise<void> {
+    await Promise.all(
+      Array.from(masterConnections.entries()).map(([controlPath, state]) =>
+        SshUtils.stopMaster(controlPath, state.remoteUser, state.remoteHost)
+      )
+    );
+    if (controlDir) {
+      fs.rmSync(controlDir, { recursive: true, force: true });
+      controlDir = undefined;
+      controlPaths.clear();
+    }
+  }
+
+  /**
+   * Asks the master owning a control socket to exit
+   */
+  private static async stopMaster(controlPath: string, remoteUser: string, remoteHost: string): Promise<void> {
+    masterConnections.delete(controlPath);
+    await new Promise<void>((resolve) => {
+      const child = spawn(
+        'ssh',
+        ['-o', `ControlPath=${controlPath}`, '-O', 'exit', '--', `${remoteUser}@${remoteHost}`],
+        { stdio: 'ignore' }
+      );
+      child.on('error', () => resolve());
+      child.on('exit', () => resolve());
+    });
+  }
+
   /**
    * Executes an SSH command on the remote server.
    *
@@ -83,35 +437,42 @@ export class SshUtils {
    * positional argument and interpreted by the remote shell.
    *
    * @param command - Command to execute on the remote side
+   * @param input - Optional data written to the remote command's stdin
    * @returns Promise that resolves with command output
    */
-  private async executeCommand(command: string): Promise<string> {
-    return new Promise((resolve, reject) => {
-      // Build SSH args as an array – no shell interpolation on the local side
-      const args: string[] = [];
-
-      if (this.debugMode) {
-        args.push('-v');
-      }
+  private async executeCommand(command: string, input?: string): Promise<string> {
+    const state = await this.ensureMasterConnection();
+    if (!state) {
+      // Without a master, ControlPath options would only make ssh warn about
+      // the missing socket on every command
+      return this.runSshCommand(this.directArgs, command, input);
+    }
+    await SshUtils.acquireSession(state);
+    try {
+      return await this.runSshCommand(this.multiplexedArgs, command, input);
+    } finally {
+      SshUtils.releaseSession(state);
+    }
+  }
 
-      args.push('-i', this.sshKeyPath);
-
-      const hostKeyOption = this.strictHostKeyChecking
-        ? 'accept-new'
-        : 'no';
-      args.push('-o', `StrictHostKeyChecking=${hostKeyOption}`);
-      args.push('-o', 'ConnectTimeout=10');
-      args.push('-o', 'ServerAliveInterval=30');
-      args.push('-o', 'ServerAliveCountMax=3');
-      // Use '--' to stop option parsing and prevent option injection via
-      // remoteUser/remoteHost values (defense in depth alongside constructor validation)
-      args.push('--');
-      args.push(`${this.remoteUser}@${this.remoteHost}`);
+  /**
+   * Spawns a single ssh process for a remote command
+   *
+   * @param baseArgs - Connection options, ending with the target
+   * @param command - Command to execute on the remote side
+   * @param input - Optional data written to the remote command's stdin
+   * @returns Promise that resolves with command output
+   */
+  private runSshCommand(baseArgs: readonly string[], command: string, input?: string): Promise<string> {
+    return new Promise((resolve, reject) => {
+      // Build SSH args as an array – no shell interpolation on the local side.
       // The remote command is a single positional arg; ssh sends it to the
       // remote shell for interpretation.
-      args.push(command);
+      const args = [...baseArgs, command];
 
-      logger.debug('SshUtils', `Executing SSH command: ssh ${args.join(' ')}`);
+      if (logger.isDebugEnabled()) {
+        logger.debug('SshUtils', `Executing SSH command: ssh ${args.join(' ')}`);
+      }
 
       // Set a timeout for the command execution (30 seconds)
       const timeoutMs = 30000;
@@ -139,10 +500,21 @@ export class SshUtils {
           logger.warn('SshUtils', `SSH command stderr: ${stderr}`);
         }
 
-        logger.debug('SshUtils', `SSH command stdout: ${stdout}`);
+        if (logger.isDebugEnabled()) {
+          logger.debug('SshUtils', `SSH command stdout: ${stdout}`);
+        }
         resolve(stdout);
       });
 
+      if (input !== undefined && childProcess.stdin) {
+        // The remote side may exit before reading everything (e.g. mkdir
+        // failed); the resulting EPIPE is reported through the exit status
+        childProcess.stdin.on('error', (stdinError) => {
+          logger.debug('SshUtils', `SSH stdin closed early: ${stdinError.message}`);
+        });
+        childProcess.stdin.end(input);
+      }
+
       // Set up the timeout
       timeoutId = setTimeout(() => {
         if (childProcess) {
@@ -263,6 +635,8 @@ export class SshUtils {
    * 
    * Uses a write-to-temp-then-mv pattern for atomic writes.
    * This prevents file corruption if the connection drops during write.
+   * Directory creation, the temp write, and the move run as one remote
+   * command chain, so a write costs a single SSH round-trip.
    * 
    * @param filePath - Path to the file (relative to remotePath)
    * @param content - Content to write
@@ -273,42 +647,24 @@ export class SshUtils {
       const remoteFilePath = `${this.remotePath}/${filePath}`;
       const timestamp = Date.now();
       const tempFilePath = `${remoteFilePath}.${timestamp}.tmp`;
-      
-      // Ensure the directory exists first
       const dirPath = remoteFilePath.substring(0, remoteFilePath.lastIndexOf('/'));
-      const escapedDir = shellEscapeSingleQuote(dirPath);
-      const mkdirCommand = `mkdir -p ${escapedDir}`;
-      await this.executeCommand(mkdirCommand);
-      
-      // Use base64 encoding to safely transfer the content
-      // This avoids issues with shell interpretation of special characters
-      const contentBuffer = Buffer.from(content);
-      const base64Content = contentBuffer.toString('base64');
       
-      // Write to temp file first — base64 payload is safe ASCII, so single-quote
-      // escaping the file path is sufficient.
+      // The content is streamed over stdin rather than embedded in the
+      // command, so it never meets the remote shell and is not bounded by
+      // the argument length limit. Each step only runs if the previous one
+      // succeeded; on failure the temp file is removed and the chain exits
+      // non-zero.
+      const escapedDir = shellEscapeSingleQuote(dirPath);
       const escapedTemp = shellEscapeSingleQuote(tempFilePath);
       const escapedFinal = shellEscapeSingleQuote(remoteFilePath);
-      const writeCommand = `echo '${base64Content}' | base64 -d > ${escapedTemp}`;
-      await this.executeCommand(writeCommand);
-      
-      // Verify temp file was written successfully
-      const checkTempCommand = `[ -f ${escapedTemp} ] && echo "FILE_EXISTS" || echo "FILE_NOT_EXISTS"`;
-      const checkTempResult = await this.executeCommand(checkTempCommand);
-      
-      if (checkTempResult.trim() !== "FILE_EXISTS") {
-        throw new Error(`Failed to write temp file: ${tempFilePath}`);
-      }
+      const writeCommand =
+        `mkdir -p ${escapedDir} && ` +
+        `cat > ${escapedTemp} && ` +
+        `mv ${escapedTemp} ${escapedFinal} && ` +
+        `echo "WRITE_OK" || { rm -f ${escapedTemp}; echo "WRITE_FAILED"; exit 1; }`;
+      const result = await this.executeCommand(writeCommand, content);
       
-      // Atomically move temp file to final location
-      const mvCommand = `mv ${escapedTemp} ${escapedFinal}`;
-      await this.executeCommand(mvCommand);
-      
-      // Verify final file exists
-      const checkCommand = `[ -f ${escapedFinal} ] && echo "FILE_EXISTS" || echo "FILE_NOT_EXISTS"`;
-      const checkResult = await this.executeCommand(checkCommand);
-      
-      if (checkResult.trim() !== "FILE_EXISTS") {
+      if (result.trim() !== 'WRITE_OK') {
         throw new Error(`Failed to verify file was created: ${remoteFilePath}`);
       }
     } catch (error) {
@@ -317,6 +673,32 @@ export class SshUtils {
     }
   }
 
+  /**
+   * Appends content to a file on the remote server
+   * 
+   * Uses the shell's `>>` (O_APPEND) so only the new content crosses the
+   * wire, in a single round-trip. Creates the file if it does not exist.
+   * 
+   * @param filePath - Path to the file (relative to remotePath)
+   * @param content - Content to append
+   * @throws Error if appending fails
+   */
+  async appendFile(filePath: string, content: string): Promise<void> {
+    try {
+      const remoteFilePath = `${this.remotePath}/${filePath}`;
+      const escaped = shellEscapeSingleQuote(remoteFilePath);
+      const appendCommand = `cat >> ${escaped} && echo "APPEND_OK"`;
+      const result = await this.executeCommand(appendCommand, content);
+      
+      if (result.trim() !== 'APPEND_OK') {
+        throw new Error(`Failed to verify append to: ${remoteFilePath}`);
+      }
+    } catch (error) {
+      logger.error('SshUtils', `Failed to append to remote file: ${error}`);
+      throw new Error(`Failed to append to remote file: ${error instanceof Error ? error.message : String(error)}`);
+    }
+  }
+
   /**
    * Lists files in a remote directory
    * 
@@ -385,8 +767,7 @@ export class SshUtils {
     try {
       // First check if the SSH key file exists
       try {
-        const fsPromises = require('fs').promises;
-        const stats = await fsPromises.stat(this.sshKeyPath);
+        const stats = await fs.promises.stat(this.sshKeyPath);
         if (!stats.isFile()) {
           logger.error('SshUtils', `SSH key is not a file: ${this.sshKeyPath}`);
           return false;
@@ -397,28 +778,24 @@ export class SshUtils {
         return false;
       }
       
-      const command = 'echo "Connection successful"';
+      // Probe the connection and make sure the remote path exists in a single
+      // round-trip. The session also starts the shared master connection,
+      // which later file operations reuse instead of reconnecting.
+      const escapedRemotePath = shellEscapeSingleQuote(this.remotePath);
+      const command =
+        `echo "Connection successful"; ` +
+        `[ -d ${escapedRemotePath} ] && echo "PATH_EXISTS" || ` +
+        `{ mkdir -p ${escapedRemotePath} && echo "PATH_CREATED" || echo "PATH_CREATE_FAILED"; }`;
       logger.info('SshUtils', `Testing SSH connection to ${this.remoteUser}@${this.remoteHost} using key ${this.sshKeyPath}`);
       logger.info('SshUtils', `Remote path: ${this.remotePath}`);
       
       const result = await this.executeCommand(command);
-      logger.info('SshUtils', `SSH test result: "${result}"`);
+      logger.info('SshUtils', `SSH test result: "${result.trim()}"`);
       
-      // Check if the remote path exists
-      try {
-        const escapedRemotePath = shellEscapeSingleQuote(this.remotePath);
-        const pathCheckCommand = `[ -d ${escapedRemotePath} ] && echo "PATH_EXISTS" || echo "PATH_NOT_EXISTS"`;
-        const pathResult = await this.executeCommand(pathCheckCommand);
-        logger.info('SshUtils', `Remote path check result: "${pathResult}"`);
-        
-        if (pathResult.trim() !== "PATH_EXISTS") {
-          logger.info('SshUtils', `Warning: Remote path ${this.remotePath} does not exist. Attempting to create it...`);
-          const mkdirCommand = `mkdir -p ${escapedRemotePath}`;
-          await this.executeCommand(mkdirCommand);
-          logger.info('SshUtils', `Created remote path ${this.remotePath}`);
-        }
-      } catch (pathError) {
-        logger.error('SshUtils', `Error checking remote path: ${pathError}`);
+      if (result.includes('PATH_CREATED')) {
+        logger.info('SshUtils', `Created remote path ${this.remotePath}`);
+      } else if (result.includes('PATH_CREATE_FAILED')) {
+        logger.error('SshUtils', `Error checking remote path: could not create ${this.remotePath}`);
       }
       
       // The connection test is successful if we received any response
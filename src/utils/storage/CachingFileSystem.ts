@@ -0,0 +1,247 @@
+import { FileSystemInterface } from './FileSystemInterface.js';
+
+/**
+ * Default time (ms) a cached existence check stays valid
+ */
+const DEFAULT_TTL_MS = 10000;
+
+/**
+ * Default maximum number of cached metadata entries
+ */
+const DEFAULT_MAX_ENTRIES = 256;
+
+interface CacheEntry<T> {
+  value: T;
+  expiresAt: number;
+}
+
+/**
+ * Read-cache decorator for a file system implementation
+ *
+ * Caches existence and directory checks for a short time so that repeated
+ * probes (each an SSH round-trip on remote banks) are served from memory;
+ * changes made by other processes become visible once the TTL expires.
+ * File contents and directory listings are never served from a cache, since
+ * callers hash contents for ETag checks and read-modify-write updates and
+ * expect listings to show files other clients created: concurrent reads of
+ * the same file only share a single underlying request.
+ */
+export class CachingFileSystem implements FileSystemInterface {
+  private readonly inner: FileSystemInterface;
+  private readonly ttlMs: number;
+  private readonly maxEntries: number;
+  private readonly metadata = new Map<string, CacheEntry<boolean>>();
+  // Bumped whenever metadata is invalidated, so a check that was already in
+  // flight during a write does not cache its pre-write answer
+  private metadataGeneration = 0;
+  private readonly pendingReads = new Map<string, Promise<string>>();
+
+  /**
+   * Creates a new CachingFileSystem instance
+   *
+   * @param inner - File system to delegate to
+   * @param options - Optional cache configuration (ttlMs, maxEntries)
+   */
+  constructor(
+    inner: FileSystemInterface,
+    options?: { ttlMs?: number; maxEntries?: number }
+  ) {
+    this.inner = inner;
+    this.ttlMs = options?.ttlMs ?? DEFAULT_TTL_MS;
+    this.maxEntries = options?.maxEntries ?? DEFAULT_MAX_ENTRIES;
+  }
+
+  /**
+   * Checks if a file or directory exists
+   *
+   * @param path - Path to check
+   * @returns True if the path exists, false otherwise
+   */
+  async fileExists(path: string): Promise<boolean> {
+    return this.cachedMetadata(`exists:${path}`, () => this.inner.fileExists(path));
+  }
+
+  /**
+   * Checks if a path is a directory
+   *
+   * @param path - Path to check
+   * @returns True if the path is a directory, false otherwise
+   */
+  async isDirectory(path: string): Promise<boolean> {
+    return this.cachedMetadata(`dir:${path}`, () => this.inner.isDirectory(path));
+  }
+
+  /**
+   * Ensures a directory exists, creating it if necessary
+   *
+   * @param path - Path to the directory
+   */
+  async ensureDirectory(path: string): Promise<void> {
+    await this.inner.ensureDirectory(path);
+    this.dropMetadata();
+  }
+
+  /**
+   * Reads a file's contents, sharing an in-flight read of the same file
+   *
+   * @param path - Path to the file
+   * @returns The file contents as a string
+   */
+  async readFile(path: string): Promise<string> {
+    const pending = this.pendingReads.get(path);
+    if (pending) {
+      return pending;
+    }
+
+    const read = this.inner.readFile(path)
+      .finally(() => {
+        if (this.pendingReads.get(path) === read) {
+          this.pendingReads.delete(path);
+        }
+      });
+    this.pendingReads.set(path, read);
+    return read;
+  }
+
+  /**
+   * Writes content to a file
+   *
+   * @param path - Path to the file
+   * @param content - Content to write
+   */
+  async writeFile(path: string, content: string): Promise<void> {
+    this.invalidate(path);
+    try {
+      await this.inner.writeFile(path, content);
+    } finally {
+      this.invalidate(path);
+    }
+  }
+
+  /**
+   * Appends content to a file
+   *
+   * @param path - Path to the file
+   * @param content - Content to append
+   */
+  async appendFile(path: string, content: string): Promise<void> {
+    this.invalidate(path);
+    try {
+      await this.inner.appendFile(path, content);
+    } finally {
+      this.invalidate(path);
+    }
+  }
+
+  /**
+   * Lists files in a directory
+   *
+   * @param path - Path to the directory
+   * @returns Array of file names
+   */
+  async listFiles(path: string): Promise<string[]> {
+    return this.inner.listFiles(path);
+  }
+
+  /**
+   * Deletes a file or directory
+   *
+   * @param path - Path to delete
+   */
+  async delete(path: string): Promise<void> {
+    try {
+      await this.inner.delete(path);
+    } finally {
+      this.invalidateTree(path);
+    }
+  }
+
+  /**
+   * Copies a file or directory
+   *
+   * @param sourcePath - Source path
+   * @param destPath - Destination path
+   */
+  async copy(sourcePath: string, destPath: string): Promise<void> {
+    try {
+      await this.inner.copy(sourcePath, destPath);
+    } finally {
+      this.invalidateTree(destPath);
+    }
+  }
+
+  /**
+   * Gets the base directory for file operations
+   *
+   * @returns The base directory path
+   */
+  getBaseDir(): string {
+    return this.inner.getBaseDir();
+  }
+
+  /**
+   * Drops every cached entry
+   */
+  clear(): void {
+    this.dropMetadata();
+    this.pendingReads.clear();
+  }
+
+  /**
+   * Returns a cached metadata value, loading it on a miss
+   */
+  private async cachedMetadata(key: string, load: () => Promise<boolean>): Promise<boolean> {
+    const cached = this.metadata.get(key);
+    if (cached && cached.expiresAt > Date.now()) {
+      return cached.value;
+    }
+    const generation = this.metadataGeneration;
+    const value = await load();
+    if (generation === this.metadataGeneration) {
+      this.metadata.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+      this.evictOverflow(this.metadata);
+    }
+    return value;
+  }
+
+  /**
+   * Drops every cached existence check, including ones still loading
+   */
+  private dropMetadata(): void {
+    this.metadata.clear();
+    this.metadataGeneration++;
+  }
+
+  /**
+   * Removes the oldest entries of a cache map beyond maxEntries
+   */
+  private evictOverflow(cache: Map<string, unknown>): void {
+    while (cache.size > this.maxEntries) {
+      const oldest = cache.keys().next().value;
+      if (oldest === undefined) break;
+      cache.delete(oldest);
+    }
+  }
+
+  /**
+   * Invalidates a single file after it changed. Existence checks are
+   * dropped wholesale since any write can affect them.
+   */
+  private invalidate(path: string): void {
+    this.pendingReads.delete(path);
+    this.dropMetadata();
+  }
+
+  /**
+   * Invalidates a path and everything beneath it
+   */
+  private invalidateTree(path: string): void {
+    const prefix = path.endsWith('/') ? path : `${path}/`;
+    for (const key of Array.from(this.pendingReads.keys())) {
+      if (key === path || key.startsWith(prefix)) {
+        this.pendingReads.delete(key);
+      }
+    }
+    this.dropMetadata();
+  }
+}
@@ -1,6 +1,7 @@
 import { FileSystemInterface } from './FileSystemInterface.js';
 import { LocalFileSystem } from './LocalFileSystem.js';
 import { RemoteFileSystem } from './RemoteFileSystem.js';
+import { CachingFileSystem } from './CachingFileSystem.js';
 import { logger } from '../LogManager.js';
 
 /**
@@ -23,11 +24,15 @@ export class FileSystemFactory {
   /**
    * Creates a remote file system implementation
    * 
+   * Existence checks are wrapped in a short-lived cache, and
+   * concurrent reads of a file are coalesced, since every remote operation
+   * is an SSH round-trip.
+   * 
    * @param baseDir - Base directory on the remote server
    * @param sshKeyPath - Path to the SSH private key file
    * @param remoteUser - Username for the remote server
    * @param remoteHost - Hostname or IP address of the remote server
-   * @returns A RemoteFileSystem instance
+   * @returns A cached RemoteFileSystem instance
    */
   static createRemoteFileSystem(
     baseDir: string,
@@ -39,7 +44,7 @@ export class FileSystemFactory {
       'FileSystemFactory',
       `Creating remote file system with base directory: ${baseDir}, remoteUser: ${remoteUser}, remoteHost: ${remoteHost}`
     );
-    return new RemoteFileSystem(baseDir, sshKeyPath, remoteUser, remoteHost);
+    return new CachingFileSystem(new RemoteFileSystem(baseDir, sshKeyPath, remoteUser, remoteHost));
   }
 
   /**